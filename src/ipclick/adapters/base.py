@@ -1,12 +1,73 @@
 from abc import ABC, abstractmethod
+import asyncio
+from collections.abc import AsyncIterator, Iterator
+import functools
 from random import randint
 import time
-from typing import Any
+from typing import Any, cast
 
 from ipclick.dto import Response
 from ipclick.utils.log_util import log
 
 
+# 计时用的单调高精度时钟（整数纳秒），绑定为模块级名称省去属性查找
+_now_ns = time.perf_counter_ns
+
+# 流式下载时每个分块的大小
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
+def _retry_params(
+    adapter: Any, args: tuple[Any, ...], kwargs: dict[str, Any], max_retries_attr: str, retry_delay_attr: str
+) -> tuple[int, float | tuple[int, int], str]:
+    """取出重试次数、重试延迟与URL：调用参数优先，其次为适配器属性"""
+    max_retries = kwargs.get("max_retries") or getattr(adapter, max_retries_attr, 3)
+    retry_delay = kwargs.get("retry_delay") or getattr(adapter, retry_delay_attr, (1, 3))
+    url = args[0] if args else kwargs.get("url", "unknown")
+    return max_retries, retry_delay, url
+
+
+def _set_elapsed(result: Any, start_ns: int) -> Any:
+    """适配器未设置响应时间时，按本次尝试的耗时设置"""
+    if hasattr(result, "elapsed_ms") and result.elapsed_ms == 0:
+        result.elapsed_ms = (_now_ns() - start_ns) // 1_000_000
+    return result
+
+
+def _on_failure(
+    url: str,
+    attempt: int,
+    max_retries: int,
+    retry_delay: float | tuple[int, int],
+    kwargs: dict[str, Any],
+    e: Exception,
+) -> Response | float:
+    """
+    处理一次失败的尝试
+
+    Returns:
+        不再重试时返回错误响应，否则返回重试前的等待时间（秒）
+    """
+    if attempt == max_retries or kwargs.get("max_retries") == 0:
+        # 最后一次尝试失败，返回错误响应
+        log.error("Download {} failed after {} attempt(s): {}", url, attempt + 1, e)
+        return Response.error_response(url, e)
+
+    # 计算退避延迟：指数退避 + 随机因子
+    sleep_time = _backoff_delay(attempt, retry_delay) if kwargs.get("retry_delay") != 0.0 else 0
+
+    # 记录重试信息，异常堆栈由适配器在 DEBUG 级别记录
+    log.warning(
+        "Download {} failed, retrying {}/{} in {}s...  Error: {}",
+        url,
+        attempt + 1,
+        max_retries,
+        sleep_time,
+        e,
+    )
+    return sleep_time
+
+
 def retry(max_retries_attr="max_retries", retry_delay_attr="retry_delay"):
     """
     重试装饰器，支持指数退避和随机延迟
@@ -17,57 +78,73 @@ def retry(max_retries_attr="max_retries", retry_delay_attr="retry_delay"):
     """
 
     def decorator(func):
+        @functools.wraps(func)
         def wrapper(self, *args, **kwargs):
-            max_retries = kwargs.get("max_retries") or getattr(self, max_retries_attr, 3)
-            retry_delay = kwargs.get("retry_delay") or getattr(self, retry_delay_attr, (1, 3))
-            url = args[0] if args else kwargs.get("url", "unknown")
-
-            last_exception = None
+            max_retries, retry_delay, url = _retry_params(self, args, kwargs, max_retries_attr, retry_delay_attr)
 
             for attempt in range(max_retries + 1):
+                start_ns = _now_ns()
                 try:
-                    start_time = time.time()
-                    result = func(self, *args, **kwargs)
+                    return _set_elapsed(func(self, *args, **kwargs), start_ns)
+                except Exception as e:
+                    outcome = _on_failure(url, attempt, max_retries, retry_delay, kwargs, e)
+                if isinstance(outcome, Response):
+                    return outcome
+                if outcome:
+                    time.sleep(outcome)
 
-                    # 设置响应时间
-                    if hasattr(result, "elapsed_ms") and result.elapsed_ms == 0:
-                        result.elapsed_ms = int((time.time() - start_time) * 1000)
+            # 理论上不会到达这里
+            return Response.error_response(url, Exception("Max retries exceeded"))
 
-                    return result
+        return wrapper
 
-                except Exception as e:
-                    last_exception = e
+    return decorator
 
-                    if attempt == max_retries or kwargs.get("max_retries") == 0:
-                        # 最后一次尝试失败，返回错误响应
-                        return Response.error_response(url, e)
 
-                    # 计算退避延迟：指数退避 + 随机因子
-                    if kwargs.get("retry_delay") != 0.0:
-                        base_delay = min(2**attempt, 600)  # 最大600秒基础延迟
-                        if isinstance(retry_delay, tuple):
-                            random_delay = randint(retry_delay[0], retry_delay[1])
-                        else:
-                            random_delay = retry_delay
+def async_retry(max_retries_attr="max_retries", retry_delay_attr="retry_delay"):
+    """
+    异步重试装饰器，行为与 retry 一致，退避等待不阻塞事件循环
 
-                        sleep_time = base_delay + random_delay
+    Args:
+        max_retries_attr: 最大重试次数属性名
+        retry_delay_attr: 重试延迟属性名
+    """
 
-                        # 记录重试信息
-                        if hasattr(self, "logger"):
-                            log.warning(
-                                f"Download {url} failed, retrying {attempt + 1}/{max_retries} in {sleep_time}s...  Error: {e}"
-                            )
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, *args, **kwargs):
+            max_retries, retry_delay, url = _retry_params(self, args, kwargs, max_retries_attr, retry_delay_attr)
 
-                        time.sleep(sleep_time)
+            for attempt in range(max_retries + 1):
+                start_ns = _now_ns()
+                try:
+                    return _set_elapsed(await func(self, *args, **kwargs), start_ns)
+                except Exception as e:
+                    outcome = _on_failure(url, attempt, max_retries, retry_delay, kwargs, e)
+                if isinstance(outcome, Response):
+                    return outcome
+                if outcome:
+                    await asyncio.sleep(outcome)
 
             # 理论上不会到达这里
-            return Response.error_response(url, last_exception or Exception("Max retries exceeded"))
+            return Response.error_response(url, Exception("Max retries exceeded"))
 
         return wrapper
 
     return decorator
 
 
+def _backoff_delay(attempt: int, retry_delay: float | tuple[int, int]) -> float:
+    """计算退避延迟：指数退避 + 随机因子"""
+    base_delay = min(2**attempt, 600)  # 最大600秒基础延迟
+    if isinstance(retry_delay, tuple):
+        random_delay = randint(retry_delay[0], retry_delay[1])
+    else:
+        random_delay = retry_delay
+
+    return base_delay + random_delay
+
+
 class DownloaderAdapter(ABC):
     """下载器抽象基类"""
 
@@ -139,6 +216,68 @@ class DownloaderAdapter(ABC):
         """
         pass
 
+    def iter_download(self, url: str, *, chunk_size: int = STREAM_CHUNK_SIZE, **kwargs) -> Iterator[Response | bytes]:
+        """
+        流式执行HTTP请求
+
+        首个元素为不含响应体的 Response，其后依次为响应体分块。
+        默认实现先完整下载再切块，支持流式读取的适配器应覆盖此方法。
+
+        Args:
+            url: 请求URL
+            chunk_size: 分块大小
+            **kwargs: 同 download
+
+        Returns:
+            Iterator: Response 与响应体分块
+        """
+        response = self.download(url, **kwargs)
+        content = response.content or b""
+        response.content = None
+        yield response
+
+        for start in range(0, len(content), chunk_size):
+            yield content[start : start + chunk_size]
+
+    async def adownload(self, url: str, **kwargs) -> Response:
+        """
+        异步执行HTTP请求
+
+        默认在事件循环的线程池中执行同步的 download，原生支持异步的适配器应覆盖此方法。
+
+        Args:
+            url: 请求URL
+            **kwargs: 同 download
+
+        Returns:
+            Response:  统一的响应对象
+        """
+        return await asyncio.to_thread(self.download, url, **kwargs)
+
+    async def aiter_download(
+        self, url: str, *, chunk_size: int = STREAM_CHUNK_SIZE, **kwargs
+    ) -> AsyncIterator[Response | bytes]:
+        """
+        异步流式执行HTTP请求，产出内容同 iter_download
+
+        默认在事件循环的线程池中逐块迭代同步的 iter_download，原生支持异步的适配器应覆盖此方法。
+
+        Args:
+            url: 请求URL
+            chunk_size: 分块大小
+            **kwargs: 同 download
+
+        Returns:
+            AsyncIterator: Response 与响应体分块
+        """
+        chunks = self.iter_download(url, chunk_size=chunk_size, **kwargs)
+        exhausted = object()
+        try:
+            while (chunk := await asyncio.to_thread(next, chunks, exhausted)) is not exhausted:
+                yield cast(Response | bytes, chunk)
+        finally:
+            chunks.close()
+
     def get(self, url: str, **kwargs) -> Response:
         """GET请求快捷方法"""
         return self.download(url, method="GET", **kwargs)
@@ -167,6 +306,13 @@ class DownloaderAdapter(ABC):
         """关闭连接，释放资源"""
         pass
 
+    async def aclose(self):
+        """关闭连接，释放资源（包括异步客户端）"""
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} {self.adapter_name}>"
+
     def __enter__(self):
         """上下文管理器入口"""
         return self
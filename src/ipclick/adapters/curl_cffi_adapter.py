@@ -1,7 +1,9 @@
-import json as json_lib
+from collections.abc import AsyncIterator, Iterator
 from typing import Any, List, Optional
 
-from ipclick.adapters.base import DownloaderAdapter, retry
+from typing_extensions import override
+
+from ipclick.adapters.base import STREAM_CHUNK_SIZE, DownloaderAdapter, async_retry, retry
 from ipclick.dto import Response
 from ipclick.utils.log_util import log
 
@@ -23,6 +25,13 @@ except ImportError:
     FAKE_UA_AVAILABLE = False
 
 
+def _cookie_dict(cookies: Any) -> Any:
+    """curl_cffi 的 Cookies 只接受 dict，其他映射类型（如 Protobuf map）复制为 dict"""
+    if cookies is None or isinstance(cookies, (dict, str)):
+        return cookies
+    return dict(cookies)
+
+
 class CurlCffiAdapter(DownloaderAdapter):
     """
     curl_cffi适配器，支持浏览器指纹伪装
@@ -32,6 +41,8 @@ class CurlCffiAdapter(DownloaderAdapter):
     - 浏览器指纹伪装
     - 更快的性能
     - 支持HTTP/2
+
+    同步与异步请求各复用一个长连接会话，避免每个请求重复建立 TCP/TLS 连接。
     """
 
     adapter_name: str = "curl_cffi"
@@ -42,22 +53,14 @@ class CurlCffiAdapter(DownloaderAdapter):
 
         super().__init__()
 
-        # HTTP方法映射
-        self.method_mapping = {
-            "GET": curl_cffi.requests.get,
-            "POST": curl_cffi.requests.post,
-            "PUT": curl_cffi.requests.put,
-            "DELETE": curl_cffi.requests.delete,
-            "PATCH": curl_cffi.requests.patch,
-            "HEAD": curl_cffi.requests.head,
-            "OPTIONS": curl_cffi.requests.options,
-        }
-
         # curl_cffi特有配置
         self.impersonate = DEFAULT_CHROME
         self.ja3 = None
         self.akamai = None
         self.session = None
+        self.async_session = None
+        # 异步会话最多同时使用的 curl 句柄数
+        self.pool_max_clients = 100
 
         # User Agent生成器
         if FAKE_UA_AVAILABLE:
@@ -71,6 +74,12 @@ class CurlCffiAdapter(DownloaderAdapter):
             self.session = curl_cffi.requests.Session(**kwargs)
         return self.session
 
+    def get_async_session(self, **kwargs):
+        """获取或创建异步会话"""
+        if self.async_session is None:
+            self.async_session = curl_cffi.requests.AsyncSession(max_clients=self.pool_max_clients, **kwargs)
+        return self.async_session
+
     @retry()
     def download(
         self,
@@ -100,7 +109,6 @@ class CurlCffiAdapter(DownloaderAdapter):
         """
         使用curl_cffi执行HTTP请求
         """
-        kwargs_dict = json_lib.loads(kwargs)
         method = method.upper()
 
         # 设置代理
@@ -109,16 +117,12 @@ class CurlCffiAdapter(DownloaderAdapter):
             proxies = {"http": proxy, "https": proxy}
 
         try:
-            # 获取请求方法
-            request_func = self.method_mapping.get(method)
-            if not request_func:
-                raise ValueError(f"Unsupported HTTP method: {method}")
-
             # 执行请求
-            curl_cffi_resp = request_func(
-                url=url,
+            curl_cffi_resp = self.get_session(impersonate=self.impersonate).request(
+                method,
+                url,
                 headers=headers,
-                cookies=cookies,
+                cookies=_cookie_dict(cookies),
                 params=params,
                 data=data,
                 json=json,
@@ -127,7 +131,9 @@ class CurlCffiAdapter(DownloaderAdapter):
                 verify=verify,
                 allow_redirects=allow_redirects,
                 stream=stream,
-                impersonate=impersonate or DEFAULT_CHROME,
+                impersonate=impersonate or self.impersonate,
+                # 会话在请求间共享，不保存响应中的cookies
+                discard_cookies=True,
             )
 
             # 转换响应
@@ -141,9 +147,112 @@ class CurlCffiAdapter(DownloaderAdapter):
             )
 
         except Exception as e:
-            log.exception(f"curl_cffi request failed for {url}: {e}")
+            log.debug("curl_cffi request failed for {}: {}", url, e, exc_info=True)
+            raise
+
+    @override
+    @async_retry()
+    async def adownload(self, url: str, **kwargs) -> Response:
+        """
+        使用curl_cffi.AsyncSession异步执行HTTP请求
+        """
+        method = kwargs.get("method", "GET").upper()
+        session = self.get_async_session(impersonate=self.impersonate)
+
+        try:
+            curl_cffi_resp = await session.request(method, url, **self._build_request_kwargs(kwargs))
+
+            return Response(
+                url=str(curl_cffi_resp.url),
+                status_code=curl_cffi_resp.status_code,
+                content=curl_cffi_resp.content,
+                text=curl_cffi_resp.text,
+                headers=dict(curl_cffi_resp.headers),
+                raw_response=curl_cffi_resp,
+            )
+
+        except Exception as e:
+            log.debug("curl_cffi request failed for {}: {}", url, e, exc_info=True)
             raise
 
+    @override
+    def iter_download(self, url: str, *, chunk_size: int = STREAM_CHUNK_SIZE, **kwargs) -> Iterator[Response | bytes]:
+        """
+        使用curl_cffi流式执行HTTP请求，响应体边读边产出，不在内存中整块保存
+
+        curl_cffi 的分块大小由底层 libcurl 决定，chunk_size 仅作接口兼容。
+        """
+        method = kwargs.get("method", "GET").upper()
+
+        # 流式响应在迭代结束前需要保持会话，因此使用独立会话
+        with curl_cffi.requests.Session() as session:
+            try:
+                curl_cffi_resp = session.request(method, url, stream=True, **self._build_request_kwargs(kwargs))
+            except Exception as e:
+                log.error("curl_cffi stream request failed for {}: {}", url, e)
+                yield Response.error_response(url, e)
+                return
+
+            try:
+                yield Response(
+                    url=str(curl_cffi_resp.url),
+                    status_code=curl_cffi_resp.status_code,
+                    headers=dict(curl_cffi_resp.headers),
+                    raw_response=curl_cffi_resp,
+                )
+                yield from curl_cffi_resp.iter_content()
+            finally:
+                curl_cffi_resp.close()
+
+    @override
+    async def aiter_download(
+        self, url: str, *, chunk_size: int = STREAM_CHUNK_SIZE, **kwargs
+    ) -> AsyncIterator[Response | bytes]:
+        """
+        使用curl_cffi.AsyncSession异步流式执行HTTP请求
+
+        同步会话的流式模式在连接快速失败时可能在工作线程中死锁，异步流式请求直接使用 AsyncSession。
+        """
+        method = kwargs.get("method", "GET").upper()
+        session = self.get_async_session(impersonate=self.impersonate)
+
+        try:
+            curl_cffi_resp = await session.request(method, url, stream=True, **self._build_request_kwargs(kwargs))
+        except Exception as e:
+            log.error("curl_cffi stream request failed for {}: {}", url, e)
+            yield Response.error_response(url, e)
+            return
+
+        try:
+            yield Response(
+                url=str(curl_cffi_resp.url),
+                status_code=curl_cffi_resp.status_code,
+                headers=dict(curl_cffi_resp.headers),
+                raw_response=curl_cffi_resp,
+            )
+            async for chunk in curl_cffi_resp.aiter_content():
+                yield chunk
+        finally:
+            await curl_cffi_resp.aclose()
+
+    def _build_request_kwargs(self, kwargs: dict[str, Any]) -> dict[str, Any]:
+        """从下载参数构建curl_cffi请求参数"""
+        proxy = kwargs.get("proxy")
+        return {
+            "headers": kwargs.get("headers"),
+            "cookies": _cookie_dict(kwargs.get("cookies")),
+            "params": kwargs.get("params"),
+            "data": kwargs.get("data"),
+            "json": kwargs.get("json"),
+            "proxies": {"http": proxy, "https": proxy} if proxy else None,
+            "timeout": kwargs.get("timeout") or self.timeout,
+            "verify": kwargs.get("verify", True),
+            "allow_redirects": kwargs.get("allow_redirects", True),
+            "impersonate": kwargs.get("impersonate") or self.impersonate,
+            # 会话在请求间共享，不保存响应中的cookies
+            "discard_cookies": True,
+        }
+
     def close(self):
         """关闭会话"""
         if self.session:
@@ -153,6 +262,15 @@ class CurlCffiAdapter(DownloaderAdapter):
                 pass
             self.session = None
 
+    @override
+    async def aclose(self):
+        """关闭会话及异步会话"""
+        self.close()
+
+        if self.async_session:
+            await self.async_session.close()
+            self.async_session = None
+
 
 def is_available() -> bool:
     """检查curl_cffi是否可用"""
@@ -1,6 +1,11 @@
+from collections.abc import AsyncIterator, Iterator
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+import threading
 from typing import Any
 
-from ipclick.adapters.base import DownloaderAdapter, retry
+from typing_extensions import override
+
+from ipclick.adapters.base import STREAM_CHUNK_SIZE, DownloaderAdapter, async_retry, retry
 from ipclick.dto import Response
 from ipclick.utils.log_util import log
 
@@ -12,6 +17,13 @@ try:
 except ImportError:
     HTTPX_AVAILABLE = False
 
+try:
+    import h2  # noqa: F401
+
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
 try:
     from fake_useragent import UserAgent
 
@@ -28,10 +40,25 @@ class HttpxAdapter(DownloaderAdapter):
     - 支持异步操作
     - HTTP/2支持
     - 完善的API
+
+    按 (proxy, verify) 复用长连接客户端，避免每个请求重复建立 TCP/TLS 连接。
     """
 
     adapter_name: str = "httpx"
 
+    # _build_request_kwargs 接受的 download 参数
+    _REQUEST_KWARG_NAMES = (
+        "headers",
+        "cookies",
+        "params",
+        "data",
+        "json",
+        "proxy",
+        "timeout",
+        "verify",
+        "allow_redirects",
+    )
+
     def __init__(self):
         if not HTTPX_AVAILABLE:
             raise ImportError("httpx is not installed. Install it with: pip install httpx")
@@ -39,6 +66,17 @@ class HttpxAdapter(DownloaderAdapter):
         super().__init__()
         self.session = None
 
+        # 连接池配置
+        self.pool_max_connections = 100
+        self.pool_max_keepalive_connections = 100
+        self.pool_keepalive_expiry = 90.0
+        self.http2 = H2_AVAILABLE
+
+        # 长连接客户端，以 (proxy, verify) 为键
+        self._clients: dict[tuple[str | None, bool], httpx.Client] = {}
+        self._async_clients: dict[tuple[str | None, bool], httpx.AsyncClient] = {}
+        self._clients_lock = threading.Lock()
+
         # User Agent生成器
         if FAKE_UA_AVAILABLE:
             self.ua_generator = UserAgent(platforms="desktop")
@@ -89,54 +127,83 @@ class HttpxAdapter(DownloaderAdapter):
         """
         使用httpx执行HTTP请求
         """
-        method = method.upper()
+        httpx_kwargs = self._build_request_kwargs(
+            headers=headers,
+            cookies=cookies,
+            params=params,
+            data=data,
+            json=json,
+            proxy=proxy,
+            timeout=timeout,
+            verify=verify,
+            allow_redirects=allow_redirects,
+        )
 
-        # 设置默认headers
-        if headers is None:
-            headers = {
-                "User-Agent": self._get_user_agent(),
-                "Accept": "*/*",
-                "Accept-Encoding": "gzip, deflate, br",
-                "Connection": "keep-alive",
-            }
-        elif "User-Agent" not in headers and "user-agent" not in headers:
-            headers["User-Agent"] = self._get_user_agent()
+        client = self._get_client(httpx_kwargs)
 
-        # 构建httpx请求参数
-        httpx_kwargs = {
-            "params": params,
-            "data": data,
-            "headers": headers,
-            "cookies": cookies,
-            "timeout": timeout or self.timeout,
-        }
+        try:
+            # 执行请求
+            httpx_resp = client.request(method.upper(), url, **httpx_kwargs)
+
+            # 转换响应
+            return Response(
+                url=str(httpx_resp.url),
+                status_code=httpx_resp.status_code,
+                content=httpx_resp.content,
+                text=httpx_resp.text,
+                headers=dict(httpx_resp.headers),
+                raw_response=httpx_resp,
+            )
 
-        # 设置代理
-        if proxy:
-            httpx_kwargs["proxies"] = proxy
+        except Exception as e:
+            log.debug("httpx request failed for {}: {}", url, e, exc_info=True)
+            raise
 
-        # 添加其他参数
-        supported_kwargs = ["content", "files", "json", "auth", "follow_redirects", "verify", "cert", "trust_env"]
-        for key in supported_kwargs:
-            if key in kwargs:
-                httpx_kwargs[key] = kwargs[key]
+    @override
+    def iter_download(self, url: str, *, chunk_size: int = STREAM_CHUNK_SIZE, **kwargs) -> Iterator[Response | bytes]:
+        """
+        使用httpx流式执行HTTP请求，响应体边读边产出，不在内存中整块保存
+        """
+        method = kwargs.pop("method", "GET").upper()
+        httpx_kwargs = self._build_request_kwargs(
+            **{key: kwargs.get(key) for key in self._REQUEST_KWARG_NAMES},
+        )
 
-        # SSL验证
-        if "verify" not in httpx_kwargs:
-            httpx_kwargs["verify"] = self.verify_ssl
+        client = self._get_client(httpx_kwargs)
 
-        # 默认跟随重定向
-        if "follow_redirects" not in httpx_kwargs:
-            httpx_kwargs["follow_redirects"] = True
+        started = False
+        try:
+            with client.stream(method, url, **httpx_kwargs) as httpx_resp:
+                started = True
+                yield Response(
+                    url=str(httpx_resp.url),
+                    status_code=httpx_resp.status_code,
+                    headers=dict(httpx_resp.headers),
+                    raw_response=httpx_resp,
+                )
+                yield from httpx_resp.iter_bytes(chunk_size=chunk_size)
+        except Exception as e:
+            # 已开始回传响应体后出错，只能中断整个流
+            if started:
+                raise
+            log.error("httpx stream request failed for {}: {}", url, e)
+            yield Response.error_response(url, e)
 
-        # 移除None值
-        httpx_kwargs = {k: v for k, v in httpx_kwargs.items() if v is not None}
+    @override
+    @async_retry()
+    async def adownload(self, url: str, **kwargs) -> Response:
+        """
+        使用httpx.AsyncClient异步执行HTTP请求
+        """
+        method = kwargs.get("method", "GET").upper()
+        request_kwargs = self._build_request_kwargs(
+            **{key: kwargs.get(key) for key in self._REQUEST_KWARG_NAMES},
+        )
+        client = self._get_async_client(request_kwargs)
 
         try:
-            # 执行请求
-            httpx_resp = httpx.request(method, url, **httpx_kwargs)
+            httpx_resp = await client.request(method, url, **request_kwargs)
 
-            # 转换响应
             return Response(
                 url=str(httpx_resp.url),
                 status_code=httpx_resp.status_code,
@@ -147,9 +214,132 @@ class HttpxAdapter(DownloaderAdapter):
             )
 
         except Exception as e:
-            log.exception(f"httpx request failed for {url}: {e}")
+            log.debug("httpx request failed for {}: {}", url, e, exc_info=True)
             raise
 
+    @override
+    async def aiter_download(
+        self, url: str, *, chunk_size: int = STREAM_CHUNK_SIZE, **kwargs
+    ) -> AsyncIterator[Response | bytes]:
+        """
+        使用httpx.AsyncClient异步流式执行HTTP请求
+        """
+        method = kwargs.get("method", "GET").upper()
+        request_kwargs = self._build_request_kwargs(
+            **{key: kwargs.get(key) for key in self._REQUEST_KWARG_NAMES},
+        )
+        client = self._get_async_client(request_kwargs)
+
+        started = False
+        try:
+            async with client.stream(method, url, **request_kwargs) as httpx_resp:
+                started = True
+                yield Response(
+                    url=str(httpx_resp.url),
+                    status_code=httpx_resp.status_code,
+                    headers=dict(httpx_resp.headers),
+                    raw_response=httpx_resp,
+                )
+                async for chunk in httpx_resp.aiter_bytes(chunk_size=chunk_size):
+                    yield chunk
+        except Exception as e:
+            # 已开始回传响应体后出错，只能中断整个流
+            if started:
+                raise
+            log.error("httpx stream request failed for {}: {}", url, e)
+            yield Response.error_response(url, e)
+
+    def _pop_client_key(self, request_kwargs: dict[str, Any]) -> tuple[str | None, bool]:
+        """从请求参数中取出只能在客户端上设置的参数，作为长连接客户端的键"""
+        return request_kwargs.pop("proxy", None), request_kwargs.pop("verify", self.verify_ssl)
+
+    def _client_kwargs(self, proxy: str | None, verify: bool) -> dict[str, Any]:
+        """构建长连接客户端参数"""
+        return {
+            "proxy": proxy,
+            "verify": verify,
+            "http2": self.http2,
+            "limits": httpx.Limits(
+                max_connections=self.pool_max_connections,
+                max_keepalive_connections=self.pool_max_keepalive_connections,
+                keepalive_expiry=self.pool_keepalive_expiry,
+            ),
+            # 客户端在请求间共享，不保存响应中的cookies
+            "cookies": CookieJar(policy=DefaultCookiePolicy(allowed_domains=[])),
+        }
+
+    def _get_client(self, request_kwargs: dict[str, Any]) -> "httpx.Client":
+        """获取长连接的同步客户端"""
+        key = self._pop_client_key(request_kwargs)
+        client = self._clients.get(key)
+        if client is None:
+            with self._clients_lock:
+                client = self._clients.get(key)
+                if client is None:
+                    client = self._clients[key] = httpx.Client(**self._client_kwargs(*key))
+        return client
+
+    def _get_async_client(self, request_kwargs: dict[str, Any]) -> "httpx.AsyncClient":
+        """获取长连接的异步客户端"""
+        key = self._pop_client_key(request_kwargs)
+        client = self._async_clients.get(key)
+        if client is None:
+            client = self._async_clients[key] = httpx.AsyncClient(**self._client_kwargs(*key))
+        return client
+
+    def _build_request_kwargs(
+        self,
+        *,
+        headers: dict[str, Any] | None = None,
+        cookies: dict[str, Any] | str | None = None,
+        params: dict[str, Any] | None = None,
+        data: Any = None,
+        json: dict[str, Any] | None = None,
+        proxy: str | None = None,
+        timeout: float | None = None,
+        verify: bool | None = None,
+        allow_redirects: bool | None = None,
+    ) -> dict[str, Any]:
+        """构建httpx请求参数"""
+        # 设置默认headers
+        if headers is None:
+            headers = {
+                "User-Agent": self._get_user_agent(),
+                "Accept": "*/*",
+                "Accept-Encoding": "gzip, deflate, br",
+                "Connection": "keep-alive",
+            }
+        else:
+            # 传入的请求头可能是只读的 Protobuf map，修改前复制
+            headers = dict(headers)
+            if "User-Agent" not in headers and "user-agent" not in headers:
+                headers["User-Agent"] = self._get_user_agent()
+
+        # 客户端在请求间共享，cookies 以请求头发送
+        if cookies:
+            if not isinstance(cookies, str):
+                cookies = "; ".join(f"{name}={value}" for name, value in cookies.items())
+            cookie_key = next((key for key in headers if key.lower() == "cookie"), "Cookie")
+            headers[cookie_key] = f"{headers[cookie_key]}; {cookies}" if headers.get(cookie_key) else cookies
+
+        httpx_kwargs = {
+            "params": params,
+            "json": json,
+            "headers": headers,
+            "proxy": proxy or None,
+            "timeout": timeout or self.timeout,
+            # SSL验证
+            "verify": self.verify_ssl if verify is None else verify,
+            # 默认跟随重定向
+            "follow_redirects": True if allow_redirects is None else allow_redirects,
+        }
+
+        # 原始请求体使用 content 参数，httpx 的 data 参数只用于表单
+        httpx_kwargs["content" if isinstance(data, (bytes, str)) else "data"] = data
+
+        # 移除None值
+        return {k: v for k, v in httpx_kwargs.items() if v is not None}
+
     def close(self):
         """关闭会话"""
         if self.session:
@@ -159,6 +349,19 @@ class HttpxAdapter(DownloaderAdapter):
                 pass
             self.session = None
 
+        for client in self._clients.values():
+            client.close()
+        self._clients.clear()
+
+    @override
+    async def aclose(self):
+        """关闭会话及异步长连接客户端"""
+        self.close()
+
+        for client in self._async_clients.values():
+            await client.aclose()
+        self._async_clients.clear()
+
 
 def is_available() -> bool:
     """检查httpx是否可用"""
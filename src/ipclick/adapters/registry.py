@@ -9,12 +9,15 @@ ADAPTER_CLASSES = {
     "httpx": HttpxAdapter,
 }
 
-# 可选：列表形式（如果只需要顺序列表）
-ADAPTER_LIST = list(ADAPTER_CLASSES.values())
 
+def get_adapter_info() -> dict[str, str]:
+    """
+    获取已注册适配器的信息
 
-def get_default_adapter() -> DownloaderAdapter:
-    return ADAPTER_LIST[0]()
+    Returns:
+        dict: 适配器名称 -> 实现类名
+    """
+    return {name: adapter_class.__name__ for name, adapter_class in ADAPTER_CLASSES.items()}
 
 
 def get_adapter(adapter_name: str) -> DownloaderAdapter:
@@ -30,9 +33,5 @@ def get_adapter(adapter_name: str) -> DownloaderAdapter:
     if adapter_name not in ADAPTER_CLASSES:
         raise RuntimeError(f"下载器适配器 {adapter_name} 尚未支持")
 
-        # TODO 应用配置
-        # self._configure_adapter(adapter)
-
-        log.debug(f"Created adapter instance: {adapter_name}")
-
+    log.debug("Created adapter instance: {}", adapter_name)
     return ADAPTER_CLASSES[adapter_name]()
@@ -2,7 +2,7 @@ from pathlib import Path
 
 import click
 
-from ipclick.config_loader import load_config
+from ipclick.config_loader import load_config, load_server_settings
 from ipclick.server import serve
 
 
@@ -43,10 +43,12 @@ def config_info(config):
     """显示配置信息"""
     try:
         cfg = load_config(config)
+        server_settings = load_server_settings(config)
         click.echo("Current configuration:")
-        click.echo(f"  Server port: {cfg.get('server', {}).get('port', 9527)}")
-        click.echo(f"  Server host: {cfg.get('server', {}).get('host', '0.0.0.0')}")
-        click.echo(f"  Max workers: {cfg.get('server', {}).get('max_workers', 10)}")
+        click.echo(f"  Server port: {server_settings.port}")
+        click.echo(f"  Server host: {server_settings.host}")
+        click.echo(f"  Max workers: {server_settings.max_workers}")
+        click.echo(f"  Processes: {server_settings.processes}")
         click.echo(f"  Client timeout: {cfg.get('client', {}).get('default_timeout', 30)}")
 
         remote_servers = cfg.get("workers", {}).get("remote_servers", [])
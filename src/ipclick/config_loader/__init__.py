@@ -1,4 +1,4 @@
-from ipclick.config_loader.loader import load_config
+from ipclick.config_loader.loader import load_config, load_server_settings
 
 
-__all__ = ["load_config"]
+__all__ = ["load_config", "load_server_settings"]
@@ -13,7 +13,7 @@ import os
 from pathlib import Path
 from typing import Any
 
-from ipclick.utils.config_util import ConfigUtil, Settings
+from ipclick.utils.config_util import ConfigUtil, ServerSettings, Settings
 
 
 DEFAULT_CONFIG_PATH = Path(__file__).parent.parent / "configs" / "default_config.toml"
@@ -22,6 +22,7 @@ HOME_CONFIG_PATH = Path.home() / ".ipclick" / "config.toml"
 
 @lru_cache(maxsize=3)
 def load_config(config_path: str | Path | None = None) -> Settings:
+    """加载配置，结果按路径缓存并在调用方之间共享，因此返回只读的 Settings"""
     config_list: list[Any] = [DEFAULT_CONFIG_PATH, HOME_CONFIG_PATH]
 
     if config_path:
@@ -38,11 +39,19 @@ def load_config(config_path: str | Path | None = None) -> Settings:
     if user_path and user_path.exists():
         config_list.append(user_path)
 
+    host, port = os.getenv("IPCLICK_HOST"), os.getenv("IPCLICK_PORT")
+    if not host and not port:
+        return ConfigUtil.load(config_list, frozen=True)
+
     config = ConfigUtil.load(config_list)
+    if host:
+        config["SERVER"]["host"] = host
+    if port:
+        config["SERVER"]["port"] = int(port)
+
+    return Settings(config, frozen_box=True)
 
-    if os.getenv("IPCLICK_HOST"):
-        config["SERVER"]["host"] = os.getenv("IPCLICK_HOST")
-    if os.getenv("IPCLICK_PORT"):
-        config["SERVER"]["port"] = int(os.getenv("IPCLICK_PORT", 9527))
 
-    return config
+def load_server_settings(config_path: str | Path | None = None) -> ServerSettings:
+    """加载配置并解析出服务端配置"""
+    return ServerSettings.from_settings(load_config(config_path))
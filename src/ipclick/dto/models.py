@@ -6,6 +6,7 @@ from typing import Any, Self
 import uuid_utils as uuid
 
 from ipclick.dto.proto import task_pb2
+from ipclick.dto.response import Response
 from ipclick.utils import json_serializer
 
 
@@ -25,19 +26,18 @@ class IPClickAdapter(Enum):
     @classmethod
     def from_pb(cls, value: int) -> Self:
         """从 Protobuf 的整型枚举值找回 Enum 成员"""
-        for member in cls:
-            if member.pb_value == value:
-                return member
-        # 默认返回或抛异常
-        return cls.CURL_CFFI
+        # 未知值默认返回 CURL_CFFI
+        return _ADAPTER_BY_PB.get(value, cls.CURL_CFFI)
 
     @classmethod
     def from_str(cls, name: str) -> Self:
         """从字符串找回 Enum 成员 (用于 SDK 参数输入等)"""
-        for member in cls:
-            if member.display_name.lower() == name.lower():
-                return member
-        return cls.CURL_CFFI
+        return _ADAPTER_BY_NAME.get(name.lower(), cls.CURL_CFFI)
+
+
+# 反查表：在服务端每个请求都会调用 from_pb，避免逐个遍历枚举成员
+_ADAPTER_BY_PB: dict[int, IPClickAdapter] = {member.pb_value: member for member in IPClickAdapter}
+_ADAPTER_BY_NAME: dict[str, IPClickAdapter] = {member.display_name.lower(): member for member in IPClickAdapter}
 
 
 class HttpMethod(Enum):
@@ -165,6 +165,11 @@ class DownloadTask:
             else:
                 adapter_member = self.adapter or IPClickAdapter.CURL_CFFI
 
+            # bytes/str 请求体原样传输，其余请求体按 JSON 编码
+            content = self.data.encode() if isinstance(self.data, str) else self.data
+            if not isinstance(content, (bytes, bytearray, memoryview)):
+                content = None
+
             return task_pb2.ReqTask(
                 uuid=str(self.uuid) or str(uuid.uuid7()),
                 adapter=adapter_member.pb_value,
@@ -173,7 +178,8 @@ class DownloadTask:
                 headers=self.headers,
                 cookies=self.cookies,
                 params=json.dumps(self.params, default=json_serializer) if self.params else None,
-                data=json.dumps(self.data, default=json_serializer) if self.data else None,
+                data=json.dumps(self.data, default=json_serializer) if self.data and content is None else None,
+                content=bytes(content) if content else None,
                 json=json.dumps(self.json, default=json_serializer) if self.json else None,
                 proxy=self.proxy,
                 timeout_seconds=self.timeout,
@@ -208,10 +214,18 @@ class DownloadResponse:
 
     elapsed_ms: int
     error: str | None = None
+    # 响应体已由服务端转存到外部对象存储时的下载地址（此时 content 为空）
+    content_url: str | None = None
 
     @classmethod
-    def from_protobuf(cls, pb_response):
-        """从protobuf响应创建对象"""
+    def from_protobuf(cls, pb_response, request: Any = None):
+        """
+        从protobuf响应创建对象
+
+        Args:
+            pb_response: protobuf响应对象
+            request: 原始请求（服务端不再回传原始请求，由客户端传入）
+        """
         try:
             text = pb_response.content.decode("utf-8", errors="ignore")
         except (UnicodeDecodeError, AttributeError):
@@ -220,7 +234,7 @@ class DownloadResponse:
         return cls(
             request_uuid=pb_response.request_uuid,
             adapter_type=pb_response.adapter,
-            request=pb_response.original_request,
+            request=request,
             url=pb_response.effective_url,
             status_code=pb_response.status_code,
             headers=dict(pb_response.response_headers),
@@ -228,13 +242,12 @@ class DownloadResponse:
             text=text,
             error=pb_response.error_message if pb_response.error_message else None,
             elapsed_ms=pb_response.response_time_ms,
+            content_url=pb_response.content_url or None,
         )
 
     @classmethod
     def from_response(cls, response, request_uuid: str = ""):
         """从统一Response对象创建"""
-        from ..dto.response import Response
-
         if isinstance(response, Response):
             return cls(
                 request_uuid=request_uuid,
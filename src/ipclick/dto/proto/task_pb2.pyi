@@ -42,7 +42,7 @@ OPTIONS: HttpMethod
 TRACE: HttpMethod
 
 class ReqTask(_message.Message):
-    __slots__ = ("uuid", "adapter", "method", "url", "headers", "cookies", "params", "data", "json", "proxy", "timeout_seconds", "max_retries", "retry_backoff_seconds", "verify_ssl", "allow_redirects", "stream", "impersonate", "extensions", "automation_config", "automation_script", "allowed_status_codes", "kwargs")
+    __slots__ = ("uuid", "adapter", "method", "url", "headers", "cookies", "params", "data", "json", "proxy", "timeout_seconds", "max_retries", "retry_backoff_seconds", "verify_ssl", "allow_redirects", "stream", "impersonate", "extensions", "automation_config", "automation_script", "allowed_status_codes", "kwargs", "content")
     class HeadersEntry(_message.Message):
         __slots__ = ("key", "value")
         KEY_FIELD_NUMBER: _ClassVar[int]
@@ -86,6 +86,7 @@ class ReqTask(_message.Message):
     AUTOMATION_SCRIPT_FIELD_NUMBER: _ClassVar[int]
     ALLOWED_STATUS_CODES_FIELD_NUMBER: _ClassVar[int]
     KWARGS_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_FIELD_NUMBER: _ClassVar[int]
     uuid: str
     adapter: AdapterType
     method: HttpMethod
@@ -108,10 +109,11 @@ class ReqTask(_message.Message):
     automation_script: str
     allowed_status_codes: _containers.RepeatedScalarFieldContainer[int]
     kwargs: str
-    def __init__(self, uuid: _Optional[str] = ..., adapter: _Optional[_Union[AdapterType, str]] = ..., method: _Optional[_Union[HttpMethod, str]] = ..., url: _Optional[str] = ..., headers: _Optional[_Mapping[str, str]] = ..., cookies: _Optional[_Mapping[str, str]] = ..., params: _Optional[str] = ..., data: _Optional[str] = ..., json: _Optional[str] = ..., proxy: _Optional[str] = ..., timeout_seconds: _Optional[float] = ..., max_retries: _Optional[int] = ..., retry_backoff_seconds: _Optional[float] = ..., verify_ssl: bool = ..., allow_redirects: bool = ..., stream: bool = ..., impersonate: _Optional[str] = ..., extensions: _Optional[_Mapping[str, str]] = ..., automation_config: _Optional[str] = ..., automation_script: _Optional[str] = ..., allowed_status_codes: _Optional[_Iterable[int]] = ..., kwargs: _Optional[str] = ...) -> None: ...
+    content: bytes
+    def __init__(self, uuid: _Optional[str] = ..., adapter: _Optional[_Union[AdapterType, str]] = ..., method: _Optional[_Union[HttpMethod, str]] = ..., url: _Optional[str] = ..., headers: _Optional[_Mapping[str, str]] = ..., cookies: _Optional[_Mapping[str, str]] = ..., params: _Optional[str] = ..., data: _Optional[str] = ..., json: _Optional[str] = ..., proxy: _Optional[str] = ..., timeout_seconds: _Optional[float] = ..., max_retries: _Optional[int] = ..., retry_backoff_seconds: _Optional[float] = ..., verify_ssl: bool = ..., allow_redirects: bool = ..., stream: bool = ..., impersonate: _Optional[str] = ..., extensions: _Optional[_Mapping[str, str]] = ..., automation_config: _Optional[str] = ..., automation_script: _Optional[str] = ..., allowed_status_codes: _Optional[_Iterable[int]] = ..., kwargs: _Optional[str] = ..., content: _Optional[bytes] = ...) -> None: ...
 
 class TaskResp(_message.Message):
-    __slots__ = ("request_uuid", "adapter", "original_request", "effective_url", "status_code", "response_headers", "content", "error_message", "response_time_ms")
+    __slots__ = ("request_uuid", "adapter", "original_request", "effective_url", "status_code", "response_headers", "content", "error_message", "response_time_ms", "content_url")
     class ResponseHeadersEntry(_message.Message):
         __slots__ = ("key", "value")
         KEY_FIELD_NUMBER: _ClassVar[int]
@@ -128,6 +130,7 @@ class TaskResp(_message.Message):
     CONTENT_FIELD_NUMBER: _ClassVar[int]
     ERROR_MESSAGE_FIELD_NUMBER: _ClassVar[int]
     RESPONSE_TIME_MS_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_URL_FIELD_NUMBER: _ClassVar[int]
     request_uuid: str
     adapter: AdapterType
     original_request: ReqTask
@@ -137,4 +140,13 @@ class TaskResp(_message.Message):
     content: bytes
     error_message: str
     response_time_ms: int
-    def __init__(self, request_uuid: _Optional[str] = ..., adapter: _Optional[_Union[AdapterType, str]] = ..., original_request: _Optional[_Union[ReqTask, _Mapping]] = ..., effective_url: _Optional[str] = ..., status_code: _Optional[int] = ..., response_headers: _Optional[_Mapping[str, str]] = ..., content: _Optional[bytes] = ..., error_message: _Optional[str] = ..., response_time_ms: _Optional[int] = ...) -> None: ...
+    content_url: str
+    def __init__(self, request_uuid: _Optional[str] = ..., adapter: _Optional[_Union[AdapterType, str]] = ..., original_request: _Optional[_Union[ReqTask, _Mapping]] = ..., effective_url: _Optional[str] = ..., status_code: _Optional[int] = ..., response_headers: _Optional[_Mapping[str, str]] = ..., content: _Optional[bytes] = ..., error_message: _Optional[str] = ..., response_time_ms: _Optional[int] = ..., content_url: _Optional[str] = ...) -> None: ...
+
+class TaskRespChunk(_message.Message):
+    __slots__ = ("meta", "content")
+    META_FIELD_NUMBER: _ClassVar[int]
+    CONTENT_FIELD_NUMBER: _ClassVar[int]
+    meta: TaskResp
+    content: bytes
+    def __init__(self, meta: _Optional[_Union[TaskResp, _Mapping]] = ..., content: _Optional[bytes] = ...) -> None: ...
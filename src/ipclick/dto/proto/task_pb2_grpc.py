@@ -42,6 +42,16 @@ class TaskServiceStub(object):
                 request_serializer=task__pb2.ReqTask.SerializeToString,
                 response_deserializer=task__pb2.TaskResp.FromString,
                 _registered_method=True)
+        self.SendStream = channel.unary_stream(
+                '/task.TaskService/SendStream',
+                request_serializer=task__pb2.ReqTask.SerializeToString,
+                response_deserializer=task__pb2.TaskRespChunk.FromString,
+                _registered_method=True)
+        self.SendBatch = channel.stream_stream(
+                '/task.TaskService/SendBatch',
+                request_serializer=task__pb2.ReqTask.SerializeToString,
+                response_deserializer=task__pb2.TaskResp.FromString,
+                _registered_method=True)
 
 
 class TaskServiceServicer(object):
@@ -57,6 +67,21 @@ class TaskServiceServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SendStream(self, request, context):
+        """大响应体分块回传，避免整块 content 在服务端内存中多次复制
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def SendBatch(self, request_iterator, context):
+        """批量任务复用同一条 HTTP/2 流，省去每个请求的 HEADERS/END_STREAM 帧与调度开销；
+        任务并发执行，响应按完成顺序返回，客户端以 request_uuid 对应请求
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_TaskServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -65,6 +90,16 @@ def add_TaskServiceServicer_to_server(servicer, server):
                     request_deserializer=task__pb2.ReqTask.FromString,
                     response_serializer=task__pb2.TaskResp.SerializeToString,
             ),
+            'SendStream': grpc.unary_stream_rpc_method_handler(
+                    servicer.SendStream,
+                    request_deserializer=task__pb2.ReqTask.FromString,
+                    response_serializer=task__pb2.TaskRespChunk.SerializeToString,
+            ),
+            'SendBatch': grpc.stream_stream_rpc_method_handler(
+                    servicer.SendBatch,
+                    request_deserializer=task__pb2.ReqTask.FromString,
+                    response_serializer=task__pb2.TaskResp.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'task.TaskService', rpc_method_handlers)
@@ -106,3 +141,57 @@ class TaskService(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def SendStream(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            '/task.TaskService/SendStream',
+            task__pb2.ReqTask.SerializeToString,
+            task__pb2.TaskRespChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def SendBatch(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/task.TaskService/SendBatch',
+            task__pb2.ReqTask.SerializeToString,
+            task__pb2.TaskResp.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
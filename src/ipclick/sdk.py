@@ -1,12 +1,14 @@
 from collections import defaultdict
+from collections.abc import Iterable, Iterator
+from functools import cached_property
 import json as json_lib
 
 import grpc
 
 from ipclick.config_loader import load_config
 from ipclick.dto.models import DownloadResponse, DownloadTask, HttpMethod, ProxyConfig
-from ipclick.dto.proto import task_pb2_grpc
-from ipclick.utils.config_util import Settings
+from ipclick.dto.proto import task_pb2, task_pb2_grpc
+from ipclick.utils.config_util import ConfigUtil, Settings
 from ipclick.utils.log_util import log
 from ipclick.utils.secure_util import SecureUtil
 
@@ -26,8 +28,16 @@ class Downloader:
         self.config_path: str | None = config_path
         self.host: str | None = host or "127.0.0.1"
         self.port: int | None = port or 9527
+        self._target: str = f"{self.host}:{self.port}"
         self.config: Settings = load_config(self.config_path)
-        log.debug(f"========== Downloader加载的设置为 ==========\n{self.config.to_json(indent=4)}")
+        log.lazy_debug(
+            "========== Downloader加载的设置为 ==========\n{}", lambda: ConfigUtil.to_json(self.config, indent=True)
+        )
+
+    @cached_property
+    def default_proxy_url(self) -> str | None:
+        """配置文件 [PROXY] 节对应的代理URL，首次使用时解析一次"""
+        return ProxyConfig(**self.config.get("PROXY", {})).to_url()
 
     def request(
         self,
@@ -60,7 +70,7 @@ class Downloader:
             if not proxy:
                 proxy = None
             elif proxy is True:
-                proxy = ProxyConfig(**self.config.get("PROXY", {})).to_url()
+                proxy = self.default_proxy_url
             elif isinstance(proxy, ProxyConfig):
                 proxy = proxy.to_url()
 
@@ -90,7 +100,7 @@ class Downloader:
             )
             return self.download(task)
         except Exception as e:
-            log.exception(f"发生异常：{e}")
+            log.exception("发生异常：{}", e)
 
     def download(self, task: DownloadTask) -> DownloadResponse:
         """
@@ -108,23 +118,79 @@ class Downloader:
         pb_request = task.to_protobuf()
 
         try:
-            with grpc.insecure_channel(
-                f"{self.host}:{self.port}",
-                options=[
-                    ("grpc.max_send_message_length", 500 * 1024 * 1024),
-                    ("grpc.max_receive_message_length", 500 * 1024 * 1024),
-                    ("grpc.enable_http_proxy", 0),
-                ],
-                compression=grpc.Compression.Gzip,
-            ) as channel:
+            with self._open_channel() as channel:
                 stub = task_pb2_grpc.TaskServiceStub(channel)
-                pb_response = stub.Send(pb_request)
-                return DownloadResponse.from_protobuf(pb_response)
+                if task.stream:
+                    pb_response = self._receive_stream(stub.SendStream(pb_request))
+                else:
+                    pb_response = stub.Send(pb_request)
+                return DownloadResponse.from_protobuf(pb_response, request=task)
         except grpc.RpcError as e:
             raise Exception(f"gRPC error: {e.details()}") from e
         except Exception as e:
             raise Exception(f"Connection error: {str(e)}") from e
 
+    def download_batch(self, tasks: Iterable[DownloadTask]) -> Iterator[DownloadResponse]:
+        """
+        批量执行下载任务
+
+        所有任务复用同一条gRPC流并在服务端并发执行，响应按完成顺序产出，而非提交顺序。
+
+        Args:
+            tasks: 下载任务对象
+
+        Returns:
+            下载响应对象，可通过 request 属性对应提交的任务
+
+        Raises:
+            Exception: 当连接失败或任务执行失败时
+        """
+        tasks_by_uuid: dict[str, DownloadTask] = {}
+
+        def requests() -> Iterator[task_pb2.ReqTask]:
+            for task in tasks:
+                pb_request = task.to_protobuf()
+                tasks_by_uuid[pb_request.uuid] = task
+                yield pb_request
+
+        try:
+            with self._open_channel() as channel:
+                stub = task_pb2_grpc.TaskServiceStub(channel)
+                for pb_response in stub.SendBatch(requests()):
+                    task = tasks_by_uuid.pop(pb_response.request_uuid, None)
+                    yield DownloadResponse.from_protobuf(pb_response, request=task)
+        except grpc.RpcError as e:
+            raise Exception(f"gRPC error: {e.details()}") from e
+
+    def _open_channel(self) -> grpc.Channel:
+        """创建到服务端的gRPC通道"""
+        return grpc.insecure_channel(
+            self._target,
+            options=[
+                ("grpc.max_send_message_length", 500 * 1024 * 1024),
+                ("grpc.max_receive_message_length", 500 * 1024 * 1024),
+                ("grpc.http2.bdp_probe", 1),
+                ("grpc.http2.lookahead_bytes", 2 * 1024 * 1024),
+                ("grpc.enable_http_proxy", 0),
+            ],
+            compression=grpc.Compression.Gzip,
+        )
+
+    @staticmethod
+    def _receive_stream(chunks: Iterator[task_pb2.TaskRespChunk]) -> task_pb2.TaskResp:
+        """
+        将流式响应分块重新组装为完整响应
+
+        Args:
+            chunks: 服务端返回的响应分块，首块为响应元信息
+
+        Returns:
+            完整的protobuf响应对象
+        """
+        pb_response = next(chunks).meta
+        pb_response.content = b"".join(chunk.content for chunk in chunks)
+        return pb_response
+
     def get(self, url: str, params=None, **kwargs) -> DownloadResponse:
         """
         发送GET请求
@@ -171,7 +237,7 @@ def get_downloader(config_path: str | None = None, host: str | None = None, port
     """获取默认下载器实例"""
     global _default_downloader
 
-    key = SecureUtil.md5([config_path, host, port])
+    key = SecureUtil.blake2b([config_path, host, port])
     if key not in _default_downloader:
         if all(bool(x) is False for x in [config_path, host, port]):
             _default_downloader[key] = Downloader()
@@ -1,23 +1,38 @@
+import asyncio
 from concurrent import futures
+import multiprocessing
+from multiprocessing.process import BaseProcess
 import signal
 import sys
+import threading
 from types import FrameType
-from typing import TypedDict, cast
 
 import grpc
-from grpc import Server
 
+from ipclick.adapters.registry import get_adapter_info
 from ipclick.config_loader import load_config
 from ipclick.dto.proto import task_pb2_grpc
 from ipclick.services import TaskService
-from ipclick.utils.config_util import Settings
+from ipclick.utils.config_util import ServerSettings, Settings
 from ipclick.utils.log_util import log
 
 
-class ServerConfig(TypedDict, total=False):
-    host: str
-    port: int
-    max_workers: int
+try:
+    import uvloop
+
+    UVLOOP_AVAILABLE = True
+except ImportError:
+    UVLOOP_AVAILABLE = False
+
+
+# 已注册的适配器在进程内不会变化，导入时计算一次
+_ADAPTER_INFO: dict[str, str] = get_adapter_info()
+
+# 停机时等待进行中请求完成的宽限期（秒）
+SHUTDOWN_GRACE_PERIOD = 10
+
+# 未配置 max_concurrent_streams 时，每个工作线程对应的并发流数
+STREAMS_PER_WORKER = 4
 
 
 class IPClickServer:
@@ -26,29 +41,73 @@ class IPClickServer:
     """
 
     def __init__(self, config_path: str | None = None):
+        self.config_path: str | None = config_path
         self.config: Settings = load_config(config_path)
-        self.server: Server | None = None
+        self.settings: ServerSettings = ServerSettings.from_settings(self.config)
+        self.server: grpc.aio.Server | None = None
         self.task_service: TaskService | None = None
+        self.processes: list[BaseProcess] = []
+        self._shutdown_task: asyncio.Task[None] | None = None
+        # 单进程模式下运行 grpc.aio 服务器的事件循环，供其他线程调用 stop()
+        self._loop: asyncio.AbstractEventLoop | None = None
         log.info("IPClickServer initialized")
 
-    def start(self, host: str | None = None, port: int | None = None) -> None:
+    def start(self, host: str | None = None, port: int | None = None, processes: int | None = None) -> None:
         """
         启动服务器
 
         Args:
             port: 服务端口（覆盖配置）
             host: 绑定地址（覆盖配置）
+            processes: 服务进程数（覆盖配置），大于1时以多进程方式共享同一端口
         """
-        server_config: ServerConfig = cast(ServerConfig, self.config["SERVER"])
-
         # 参数优先级：函数参数 > 配置文件 > 默认值
-        server_host: str = host or server_config.get("host", "[::]")
-        server_port: int = port or server_config.get("port", 9527)
-        max_workers: int = port or server_config.get("max_workers", 10)
+        server_host: str = host or self.settings.host
+        server_port: int = port or self.settings.port
+        max_workers: int = self.settings.max_workers
+        server_processes: int = processes or self.settings.processes
+        max_concurrent_streams: int = self.settings.max_concurrent_streams or max_workers * STREAMS_PER_WORKER
+        max_message_length: int = self.settings.max_message_length
+
+        if server_processes > 1:
+            if sys.platform == "win32":
+                log.warning("SO_REUSEPORT is not supported on Windows, falling back to single process")
+            else:
+                self._start_processes(server_host, server_port, server_processes)
+                return
+
+        try:
+            # 已安装 uvloop 时使用其事件循环（Windows 不支持，使用默认事件循环）
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop if UVLOOP_AVAILABLE else None) as runner:
+                runner.run(
+                    self._serve(server_host, server_port, max_workers, max_concurrent_streams, max_message_length)
+                )
+        except KeyboardInterrupt:
+            log.info("Received KeyboardInterrupt, shutting down...")
+
+    async def _serve(
+        self, host: str, port: int, max_workers: int, max_concurrent_streams: int, max_message_length: int
+    ) -> None:
+        """
+        在事件循环中运行 grpc.aio 服务器，直到服务器终止
+
+        请求处理为协程，出站HTTP等待期间不占用线程；不支持异步的适配器
+        在事件循环默认线程池（max_workers 个线程）中执行。
+
+        Args:
+            host: 绑定地址
+            port: 服务端口
+            max_workers: 阻塞型适配器使用的线程数
+            max_concurrent_streams: 单连接最大并发流数
+            max_message_length: 单条消息最大长度（字节）
+        """
+        loop = self._loop = asyncio.get_running_loop()
+        loop.set_default_executor(
+            futures.ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ipclick-grpc")
+        )
 
         # 创建gRPC服务器
-        self.server = grpc.server(
-            futures.ThreadPoolExecutor(max_workers=max_workers),
+        self.server = grpc.aio.server(
             options=[
                 ("grpc.keepalive_time_ms", 60000),
                 ("grpc.keepalive_timeout_ms", 30000),
@@ -56,10 +115,15 @@ class IPClickServer:
                 ("grpc.http2.max_pings_without_data", 2),
                 ("grpc.http2.min_time_between_pings_ms", 10000),
                 ("grpc.http2.min_ping_interval_without_data_ms", 120000),
-                ("grpc.max_send_message_length", 500 * 1024 * 1024),  # 500MB
-                ("grpc.max_receive_message_length", 500 * 1024 * 1024),
-                ("grpc.max_concurrent_streams", 100),
+                ("grpc.max_send_message_length", max_message_length),
+                ("grpc.max_receive_message_length", max_message_length),
+                # 并发流上限需大于线程数，多出的请求在服务端排队，而不是让客户端建更多连接
+                ("grpc.max_concurrent_streams", max_concurrent_streams),
+                # HTTP/2 流控：开启 BDP 探测自动扩大窗口，并提高初始窗口，避免大响应体传输停顿
+                ("grpc.http2.bdp_probe", 1),
+                ("grpc.http2.lookahead_bytes", 2 * 1024 * 1024),
                 ("grpc.enable_http_proxy", 0),
+                ("grpc.so_reuseport", 1),  # 允许多进程绑定同一端口
             ],
             compression=grpc.Compression.Gzip,
         )
@@ -72,38 +136,125 @@ class IPClickServer:
             task_pb2_grpc.add_TaskServiceServicer_to_server(self.task_service, self.server)
 
             # 绑定地址
-            listen_addr = f"{server_host}:{server_port}"
+            listen_addr = f"{host}:{port}"
             bound_port: int = self.server.add_insecure_port(listen_addr)
             if bound_port == 0:
                 raise RuntimeError(f"Failed to bind to address {listen_addr}")
 
             # 启动服务器
-            self.server.start()
+            await self.server.start()
 
             # 记录启动信息
-            log.info(f"IPClick server started on {listen_addr} with {max_workers} workers")
+            log.info(
+                "IPClick server started on {} with {} workers, adapters: {}, default: {!r}",
+                listen_addr,
+                max_workers,
+                _ADAPTER_INFO,
+                self.task_service.default_adapter,
+            )
 
             # 注册信号处理
-            self._setup_signal_handlers()
+            self._setup_loop_signal_handlers(loop)
 
             # 等待终止
-            try:
-                _ = self.server.wait_for_termination()
-            except KeyboardInterrupt:
-                log.info("Received KeyboardInterrupt, shutting down...")
-                self.stop()
+            _ = await self.server.wait_for_termination()
 
         except Exception as e:
-            log.exception(f"Failed to start server: {e}")
-            self.stop()
+            log.exception("Failed to start server: {}", e)
             raise
 
+        finally:
+            await self._cleanup()
+
+    def _setup_loop_signal_handlers(self, loop: asyncio.AbstractEventLoop) -> None:
+        """设置事件循环中的信号处理器，收到信号后在事件循环中优雅停机"""
+        # 只有主线程能注册信号处理器；在其他线程中运行时由调用方通过 stop() 停机
+        if threading.current_thread() is not threading.main_thread():
+            return
+
+        shutdown_event = asyncio.Event()
+
+        def signal_handler(signum: int) -> None:
+            # 重复收到信号时不再重复停机
+            if shutdown_event.is_set():
+                return
+            shutdown_event.set()
+            self._shutdown_task = loop.create_task(self._graceful_shutdown(signum))
+
+        signals = [signal.SIGINT, signal.SIGTERM]
+        # Windows 下的 Ctrl+Break
+        if hasattr(signal, "SIGBREAK"):
+            signals.append(signal.SIGBREAK)
+
+        for signum in signals:
+            try:
+                loop.add_signal_handler(signum, signal_handler, signum)
+            except NotImplementedError:
+                # Windows 事件循环不支持 add_signal_handler
+                _ = signal.signal(signum, lambda s, _: loop.call_soon_threadsafe(signal_handler, s))
+
+    async def _graceful_shutdown(self, signum: int) -> None:
+        """
+        优雅停机：不再接受新请求，等待进行中的请求完成，超过宽限期后取消
+
+        Args:
+            signum: 收到的信号
+        """
+        signal_name = signal.Signals(signum).name
+        log.info("Received signal {} ({}), shutting down...", signal_name, signum)
+        if self.server:
+            await self.server.stop(grace=SHUTDOWN_GRACE_PERIOD)
+
+    async def _cleanup(self) -> None:
+        """服务器终止后释放任务服务资源"""
+        if self.task_service:
+            await self.task_service.cleanup()
+            self.task_service = None
+
+        self.server = None
+        self._loop = None
+        log.info("IPClick server stopped")
+
+    def _start_processes(self, host: str, port: int, processes: int) -> None:
+        """
+        以多进程方式启动服务器
+
+        每个子进程各自运行一个gRPC服务器，通过 SO_REUSEPORT 绑定同一地址，
+        由内核在进程间分发连接，以绕开单进程GIL的限制。
+        父进程只负责监管子进程，并在收到终止信号时转发给子进程。
+
+        Args:
+            host: 绑定地址
+            port: 服务端口
+            processes: 服务进程数
+        """
+        ctx = multiprocessing.get_context("spawn")
+        for i in range(processes):
+            process = ctx.Process(
+                target=_serve_process,
+                args=(self.config_path, host, port),
+                name=f"ipclick-server-{i}",
+            )
+            process.start()
+            self.processes.append(process)
+
+        log.info("IPClick server started on {}:{} with {} processes", host, port, processes)
+
+        self._setup_signal_handlers()
+
+        try:
+            for process in self.processes:
+                process.join()
+        except KeyboardInterrupt:
+            log.info("Received KeyboardInterrupt, shutting down...")
+            self.stop()
+
     def _setup_signal_handlers(self):
         """设置信号处理器"""
 
         def signal_handler(signum: int, frame: FrameType | None) -> None:
             signal_name = signal.Signals(signum).name
-            log.info(f"Received signal {signal_name} ({signum}), shutting down...")
+            log.info("Received signal {} ({}), shutting down...", signal_name, signum)
             self.stop()
             sys.exit(0)
 
@@ -115,23 +266,56 @@ class IPClickServer:
         if hasattr(signal, "SIGBREAK"):
             _ = signal.signal(signal.SIGBREAK, signal_handler)
 
-    def stop(self, grace_period: int = 10):
+    def stop(self, grace_period: int = SHUTDOWN_GRACE_PERIOD):
         """
         停止服务器
 
+        单进程模式下在服务器的事件循环中优雅停机，可从任意线程调用；从其他线程调用时等待停机完成。
+        多进程模式下将终止信号转发给子进程并等待其退出。
+
         Args:
             grace_period: 优雅停机时间（秒）
         """
-        if self.server:
-            log.info(f"Stopping gRPC server (grace period: {grace_period}s)...")
-            _ = self.server.stop(grace=grace_period)
-
-        if self.task_service:
-            self.task_service.cleanup()
+        server, loop = self.server, self._loop
+        if server is not None and loop is not None and not loop.is_closed():
+            try:
+                running_loop = asyncio.get_running_loop()
+            except RuntimeError:
+                running_loop = None
+            if running_loop is loop:
+                # 在事件循环内调用时不能阻塞等待
+                self._shutdown_task = loop.create_task(server.stop(grace=grace_period))
+            else:
+                future = asyncio.run_coroutine_threadsafe(server.stop(grace=grace_period), loop)
+                try:
+                    future.result()
+                except futures.CancelledError:
+                    # 服务器终止后事件循环随即关闭，尚未返回的 stop() 会被取消
+                    pass
+            return
+
+        if not self.processes:
+            return
+
+        # 转发终止信号给子进程
+        for process in self.processes:
+            if process.is_alive():
+                process.terminate()
+        for process in self.processes:
+            process.join(grace_period)
+        self.processes.clear()
 
         log.info("IPClick server stopped")
 
 
+def _serve_process(config_path: str | None, host: str, port: int) -> None:
+    """多进程模式下子进程的入口"""
+    try:
+        IPClickServer(config_path).start(host=host, port=port, processes=1)
+    except KeyboardInterrupt:
+        pass
+
+
 def serve(config_path: str | None = None, host: str | None = None, port: int | None = None):
     """启动IPClick服务器的便捷函数。
 
@@ -151,7 +335,7 @@ def serve(config_path: str | None = None, host: str | None = None, port: int | N
     except KeyboardInterrupt:
         pass  # 正常退出
     except Exception as e:
-        log.exception(f"Server startup failed: {e}")
+        log.exception("Server startup failed: {}", e)
         raise
 
 
@@ -0,0 +1,71 @@
+import asyncio
+from datetime import timedelta
+import io
+
+from ipclick.utils.config_util import OffloadSettings
+
+
+try:
+    from minio import Minio
+
+    MINIO_AVAILABLE = True
+except ImportError:
+    MINIO_AVAILABLE = False
+
+
+class ContentStore:
+    """
+    大响应体外部存储（S3/MinIO）
+
+    响应体上传一次后由客户端直接从对象存储下载，gRPC 只回传预签名地址，
+    避免大响应体经 gRPC 整块复制与传输。
+    """
+
+    def __init__(self, settings: OffloadSettings):
+        if not MINIO_AVAILABLE:
+            raise ImportError("minio is not installed. Install it with: pip install minio")
+
+        self.settings: OffloadSettings = settings
+        self.client = Minio(
+            settings.endpoint,
+            access_key=settings.access_key or None,
+            secret_key=settings.secret_key or None,
+            secure=settings.secure,
+        )
+
+    def should_offload(self, content: bytes | None) -> bool:
+        """响应体超过阈值时转存"""
+        return content is not None and len(content) > self.settings.threshold
+
+    async def put(self, key: str, content: bytes, content_type: str | None = None) -> str:
+        """
+        上传响应体并返回预签名下载地址
+
+        MinIO 客户端为同步实现，在事件循环的线程池中执行。
+
+        Args:
+            key: 对象名
+            content: 响应体
+            content_type: 内容类型
+
+        Returns:
+            str: 预签名下载地址
+        """
+        return await asyncio.to_thread(self._put, key, content, content_type)
+
+    def _put(self, key: str, content: bytes, content_type: str | None) -> str:
+        _ = self.client.put_object(
+            self.settings.bucket,
+            key,
+            io.BytesIO(content),
+            len(content),
+            content_type=content_type or "application/octet-stream",
+        )
+        return self.client.presigned_get_object(
+            self.settings.bucket, key, expires=timedelta(seconds=self.settings.expires)
+        )
+
+
+def is_available() -> bool:
+    """检查minio是否可用"""
+    return MINIO_AVAILABLE
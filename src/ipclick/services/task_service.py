@@ -1,21 +1,69 @@
-import json
+import asyncio
+from collections.abc import AsyncIterator, Mapping
+import sys
 import time
-from typing import Any
+from typing import Any, cast
 
+import grpc
 from grpc import ServicerContext
 from typing_extensions import override
 
 from ipclick import IPClickAdapter
 from ipclick.adapters.base import DownloaderAdapter
-from ipclick.adapters.registry import ADAPTER_CLASSES, get_adapter, get_default_adapter
+from ipclick.adapters.registry import ADAPTER_CLASSES, get_adapter
 from ipclick.dto import Response
 from ipclick.dto.models import METHOD_MAP
 from ipclick.dto.proto import task_pb2, task_pb2_grpc
-from ipclick.utils import json_hook
-from ipclick.utils.config_util import Settings
+from ipclick.services.content_store import ContentStore
+from ipclick.utils import json_loads
+from ipclick.utils.config_util import OffloadSettings, ServerSettings, Settings
 from ipclick.utils.log_util import log
 
 
+# 计时用的单调高精度时钟（整数纳秒），绑定为模块级名称省去属性查找
+_now_ns = time.perf_counter_ns
+
+# 本身已压缩的内容类型，再做 gzip 几乎没有收益
+PRECOMPRESSED_CONTENT_TYPES = (
+    "image/",
+    "video/",
+    "audio/",
+    "font/woff2",
+    "application/zip",
+    "application/gzip",
+    "application/x-gzip",
+    "application/x-bzip2",
+    "application/x-7z-compressed",
+    "application/x-rar-compressed",
+)
+
+# 可通过 [DOWNLOADER] 配置的适配器参数
+ADAPTER_CONFIG_KEYS = (
+    "max_retries",
+    "retry_delay",
+    "timeout",
+    "verify_ssl",
+    "impersonate",
+    "pool_max_connections",
+    "pool_max_keepalive_connections",
+    "pool_keepalive_expiry",
+    "pool_max_clients",
+)
+
+# 按 Protobuf 枚举值索引的查找表，每个请求只需一次下标访问
+_METHOD_BY_ENUM: tuple[str, ...] = tuple(sys.intern(METHOD_MAP[value]) for value in range(len(METHOD_MAP)))
+_ADAPTER_NAME_BY_ENUM: tuple[str, ...] = tuple(
+    sys.intern(IPClickAdapter.from_pb(value).display_name) for value in range(len(task_pb2.AdapterType.keys()))
+)
+
+
+def _as_mapping(key: str, value: Any) -> Mapping[str, Any]:
+    """JSON 解码得到的参数须为映射类型，否则抛出 TypeError"""
+    if isinstance(value, Mapping):
+        return value
+    raise TypeError(f"Parameter '{key}' must be a mapping, got {type(value)}")
+
+
 class TaskService(task_pb2_grpc.TaskServiceServicer):
     """
     重构后的任务处理服务
@@ -30,21 +78,68 @@ class TaskService(task_pb2_grpc.TaskServiceServicer):
 
     def __init__(self, config: Settings):
         self.config: Settings = config
-        # 适配器配置
-        self.adapter_config: dict[str, Any] = {
-            "DOWNLOADER": self.config.get("DOWNLOADER", {}),
-            "BROWSER": self.config.get("BROWSER", {}),
+        self.server_settings: ServerSettings = ServerSettings.from_settings(config)
+        # 适配器配置，启动时一次性转为普通 dict，之后的读取不再经过 Box 的 __getitem__
+        self.adapter_config: dict[str, dict[str, Any]] = {
+            "DOWNLOADER": self.config.get("DOWNLOADER", Settings()).to_dict(),
+            "BROWSER": self.config.get("BROWSER", Settings()).to_dict(),
         }
 
-        self._adapter_cache: dict[str, DownloaderAdapter] = {}
-        # 获取默认适配器
-        self.default_adapter: DownloaderAdapter = get_default_adapter()
+        # 启动时创建全部适配器并一次性应用配置，各适配器在请求间复用长连接客户端
+        self._adapter_cache: dict[str, DownloaderAdapter] = {name: get_adapter(name) for name in ADAPTER_CLASSES}
+        for name, adapter in self._adapter_cache.items():
+            self._apply_adapter_config(adapter, self._get_adapter_config(name))
+        # 按 Protobuf 枚举值索引的适配器实例，未注册的适配器为 None
+        self._adapter_by_pb: tuple[DownloaderAdapter | None, ...] = tuple(
+            self._adapter_cache.get(name) for name in _ADAPTER_NAME_BY_ENUM
+        )
+        # 默认适配器为注册表中的第一个，复用已配置的实例
+        self.default_adapter: DownloaderAdapter = next(iter(self._adapter_cache.values()))
+
+        # 转发给目标站点的请求头白名单（小写），未配置时转发全部请求头
+        header_allowlist = self.adapter_config["DOWNLOADER"].get("header_allowlist")
+        self._header_allowlist: frozenset[str] | None = (
+            frozenset(sys.intern(name.lower()) for name in header_allowlist) if header_allowlist is not None else None
+        )
+
+        # 大响应体外部存储，未启用时为 None
+        offload_settings = OffloadSettings.from_settings(config)
+        self.content_store: ContentStore | None = ContentStore(offload_settings) if offload_settings.enabled else None
 
         # 记录初始化信息
-        log.debug(f"TaskService initialized with default adapter: {self.default_adapter}")
+        log.debug("TaskService initialized with default adapter: {}", self.default_adapter)
+
+    def _get_adapter_config(self, adapter_name: str) -> dict[str, Any]:
+        """
+        获取适配器配置：[DOWNLOADER] 中的通用项，由 [DOWNLOADER.<适配器名>] 中的同名项覆盖
+
+        Args:
+            adapter_name: 适配器名称
+
+        Returns:
+            dict: 适配器配置
+        """
+        downloader_config = self.adapter_config["DOWNLOADER"]
+        return {**downloader_config, **downloader_config.get(adapter_name, {})}
+
+    @staticmethod
+    def _apply_adapter_config(adapter: DownloaderAdapter, adapter_config: Mapping[str, Any]) -> None:
+        """
+        将配置中的已知参数设置到适配器上，只在创建适配器时执行一次
+
+        Args:
+            adapter: 适配器实例
+            adapter_config: 适配器配置
+        """
+        for key in ADAPTER_CONFIG_KEYS:
+            value = adapter_config.get(key)
+            if value is None or not hasattr(adapter, key):
+                continue
+            # TOML 中的数组对应元组形式的参数，如 retry_delay = [1, 3]
+            setattr(adapter, key, tuple(value) if isinstance(value, list) else value)
 
     @override
-    def Send(self, request: "task_pb2.ReqTask", context: ServicerContext) -> "task_pb2.TaskResp":
+    async def Send(self, request: "task_pb2.ReqTask", context: ServicerContext) -> "task_pb2.TaskResp":
         """
         处理gRPC任务请求
 
@@ -55,34 +150,191 @@ class TaskService(task_pb2_grpc.TaskServiceServicer):
         Returns:
             task_pb2.TaskResp: gRPC响应对象
         """
-        log.info(f"Received request: {request.uuid} for URL: {request.url}")
-        start_time = time.time()
+        grpc_response, response = await self._handle(request)
+        if not self._should_compress(response):
+            context.set_compression(grpc.Compression.NoCompression)
+
+        return grpc_response
+
+    @override
+    async def SendStream(
+        self, request: "task_pb2.ReqTask", context: ServicerContext
+    ) -> AsyncIterator["task_pb2.TaskRespChunk"]:
+        """
+        处理gRPC流式任务请求
+
+        首块携带响应元信息，其后按分块回传响应体，大响应体无需在内存中整块保存。
+
+        Args:
+            request: gRPC请求对象
+            context: gRPC上下文
+
+        Returns:
+            AsyncIterator[task_pb2.TaskRespChunk]: 响应分块
+        """
+        log.info("Received stream request: {} for URL: {}", request.uuid, request.url)
+        start_ns = _now_ns()
+
+        adapter = self._get_adapter(request)
+        chunks = adapter.aiter_download(request.url, **self._build_download_kwargs(request))
+
+        # 首个元素为不含响应体的 Response
+        response = cast(Response, await anext(chunks))
+        meta = self._build_grpc_response(request, response)
+        meta.response_time_ms = (_now_ns() - start_ns) // 1_000_000
+        yield task_pb2.TaskRespChunk(meta=meta)
+
+        async for chunk in chunks:
+            yield task_pb2.TaskRespChunk(content=cast(bytes, chunk))
+
+        log.info(
+            "Stream request {} completed in {}ms, status: {}, adapter: {}",
+            request.uuid,
+            (_now_ns() - start_ns) // 1_000_000,
+            meta.status_code,
+            adapter.adapter_name,
+        )
+
+    @override
+    async def SendBatch(
+        self, request_iterator: AsyncIterator["task_pb2.ReqTask"], context: ServicerContext
+    ) -> AsyncIterator["task_pb2.TaskResp"]:
+        """
+        处理gRPC批量任务请求
+
+        多个任务复用同一条流，收到即并发执行，响应按完成顺序返回，客户端以 request_uuid 对应请求。
+        同时执行的任务数不超过 batch_concurrency，达到上限时暂停读取请求流，由 gRPC 流控向客户端施加背压；
+        单个任务出错时只为该任务返回带 error_message 的响应，不影响同一批次的其他任务。
+
+        Args:
+            request_iterator: gRPC请求流
+            context: gRPC上下文
+
+        Returns:
+            AsyncIterator[task_pb2.TaskResp]: gRPC响应流
+        """
+        responses: asyncio.Queue[task_pb2.TaskResp | None] = asyncio.Queue()
+        limit = asyncio.Semaphore(self.server_settings.batch_concurrency or self.server_settings.max_workers)
+
+        async def handle(request: task_pb2.ReqTask) -> None:
+            try:
+                grpc_response, _ = await self._handle(request)
+            except Exception as e:
+                log.exception("Batch request {} failed: {}", request.uuid, e)
+                grpc_response = task_pb2.TaskResp(
+                    request_uuid=request.uuid, adapter=request.adapter, error_message=str(e)
+                )
+            finally:
+                limit.release()
+            responses.put_nowait(grpc_response)
+
+        async def receive() -> None:
+            async with asyncio.TaskGroup() as task_group:
+                async for request in request_iterator:
+                    await limit.acquire()
+                    _ = task_group.create_task(handle(request))
+
+        receiver = asyncio.create_task(receive())
+        # 全部任务完成或出错后结束响应流
+        receiver.add_done_callback(lambda _: responses.put_nowait(None))
+        try:
+            while (grpc_response := await responses.get()) is not None:
+                yield grpc_response
+            await receiver
+        finally:
+            _ = receiver.cancel()
+
+    async def _handle(self, request: task_pb2.ReqTask) -> tuple[task_pb2.TaskResp, Response]:
+        """
+        执行单个任务并构造gRPC响应
+
+        Args:
+            request: gRPC请求对象
+
+        Returns:
+            tuple: gRPC响应对象与统一响应对象
+        """
+        log.info("Received request: {} for URL: {}", request.uuid, request.url)
+        start_ns = _now_ns()
 
         # 选择适配器
-        adapter_member = IPClickAdapter.from_pb(request.adapter)
-        if adapter_member.display_name not in self._adapter_cache:
-            adapter = get_adapter(adapter_member.display_name)
-        else:
-            adapter = self._adapter_cache[adapter_member.display_name]
+        adapter = self._get_adapter(request)
 
         # 执行下载
-        response = self._execute_download(adapter, request)
+        response = await self._execute_download(adapter, request)
+
+        # 大响应体转存到外部存储
+        content_url = await self._offload_content(request, response) if self.content_store else None
 
         # 构造gRPC响应
         grpc_response = self._build_grpc_response(request, response)
+        if content_url:
+            grpc_response.content_url = content_url
 
         # 设置响应时间
-        elapsed_ms = int((time.time() - start_time) * 1000)
+        elapsed_ms = (_now_ns() - start_ns) // 1_000_000
         grpc_response.response_time_ms = elapsed_ms
 
         # 记录成功日志
         log.info(
-            f"Request {request.uuid} completed in {elapsed_ms}ms, status:  {grpc_response.status_code}, adapter: {adapter_member.display_name}"
+            "Request {} completed in {}ms, status: {}, adapter: {}",
+            request.uuid,
+            elapsed_ms,
+            grpc_response.status_code,
+            adapter.adapter_name,
         )
 
-        return grpc_response
+        return grpc_response, response
+
+    async def _offload_content(self, request: task_pb2.ReqTask, response: Response) -> str | None:
+        """
+        将超过阈值的响应体上传到外部存储
+
+        上传成功后清空 response.content，响应中只回传下载地址；上传失败时仍随响应回传响应体。
+
+        Args:
+            request: gRPC请求对象
+            response: 统一响应对象
+
+        Returns:
+            str | None: 下载地址，未转存时为 None
+        """
+        content_store = cast(ContentStore, self.content_store)
+        if not content_store.should_offload(response.content):
+            return None
+
+        try:
+            content_url = await content_store.put(
+                request.uuid, cast(bytes, response.content), response.get_content_type()
+            )
+        except Exception as e:
+            log.warning("Offloading content of request {} failed, sending inline: {}", request.uuid, e)
+            return None
+
+        response.content = None
+        return content_url
+
+    def _get_adapter(self, request: task_pb2.ReqTask) -> DownloaderAdapter:
+        """
+        根据请求选择适配器
 
-    def _execute_download(self, adapter: DownloaderAdapter, request: task_pb2.ReqTask) -> Response:
+        Args:
+            request: gRPC请求对象
+
+        Returns:
+            DownloaderAdapter: 适配器实例
+        """
+        pb_adapter = request.adapter
+        # 未知值默认使用 CURL_CFFI
+        if not 0 <= pb_adapter < len(self._adapter_by_pb):
+            pb_adapter = 0
+        adapter = self._adapter_by_pb[pb_adapter]
+        if adapter is None:
+            # 未注册的适配器，由 get_adapter 抛出不支持的错误
+            return get_adapter(_ADAPTER_NAME_BY_ENUM[pb_adapter])
+        return adapter
+
+    async def _execute_download(self, adapter: DownloaderAdapter, request: task_pb2.ReqTask) -> Response:
         """
         执行下载请求
 
@@ -93,21 +345,43 @@ class TaskService(task_pb2_grpc.TaskServiceServicer):
         Returns:
             Response: 统一响应对象
         """
-        # 转换HTTP方法
-        method = METHOD_MAP.get(request.method, "GET")
+        return await adapter.adownload(request.url, **self._build_download_kwargs(request))
 
-        # 处理请求头
-        headers = dict(request.headers) if request.headers else None
-        cookies = dict(request.cookies) if request.cookies else None
-        params = json.loads(request.params, object_hook=json_hook) if request.params else None
-        # 处理请求体
-        data = json.loads(request.data) if request.data else None
-        json_data = json.loads(request.json) if request.json else None
+    def _build_download_kwargs(self, request: task_pb2.ReqTask) -> dict[str, Any]:
+        """
+        从gRPC请求构建适配器下载参数
+
+        Args:
+            request: gRPC请求对象
+
+        Returns:
+            dict: 下载参数
+        """
+        # 转换HTTP方法
+        pb_method = request.method
+        method = _METHOD_BY_ENUM[pb_method] if 0 <= pb_method < len(_METHOD_BY_ENUM) else "GET"
+
+        # 处理请求头，Protobuf map 本身即 MutableMapping，可直接交给适配器；配置了白名单时只转发白名单内的请求头
+        headers = request.headers or None
+        if headers and self._header_allowlist is not None:
+            headers = {k: v for k, v in headers.items() if k.lower() in self._header_allowlist} or None
+        # Protobuf map 以只读方式交给适配器，需要修改或特定类型的适配器自行复制
+        cookies = request.cookies or None
+        # 每次读取 Protobuf 的 string/bytes 字段都会新建 Python 对象，各字段只读取一次
+        params_text, data_text, json_text, content = request.params, request.data, request.json, request.content
+        # 查询参数最终由适配器转为字符串，日期时间字符串原样转发，无需还原为 datetime
+        params = _as_mapping("params", json_loads(params_text)) if params_text else None
+        # 处理请求体，原始请求体直接透传
+        if content:
+            data = content
+        else:
+            data = _as_mapping("data", json_loads(data_text)) if data_text else None
+        json_data = _as_mapping("json", json_loads(json_text)) if json_text else None
 
-        extensions = dict(request.extensions) if request.extensions else None
+        extensions = request.extensions or None
 
-        # 构建下载参数
-        download_kwargs = {
+        # 其余字段在 Protobuf 中已是目标类型，直接构建下载参数
+        return {
             "method": method,
             "headers": headers,
             "cookies": cookies,
@@ -128,53 +402,19 @@ class TaskService(task_pb2_grpc.TaskServiceServicer):
             "kwargs": request.kwargs,
         }
 
-        # 构建并验证下载参数
-        download_kwargs = self._validate_and_convert_params(download_kwargs)
-
-        # 执行下载
-        return adapter.download(request.url, **download_kwargs)
-
-    @staticmethod
-    def _validate_and_convert_params(params: dict[str, Any]) -> dict[str, Any]:
-        """
-        验证并转换参数类型以符合适配器方法的要求
+    def _should_compress(self, response: Response) -> bool:
         """
-        validated_params: dict[str, Any] = {}
+        判断响应是否值得gzip压缩
 
-        for key, value in params.items():
-            if value is None:
-                validated_params[key] = None
-                continue
+        响应体过小或内容本身已压缩（图片、音视频、压缩包等）时跳过压缩。
+        适配器返回的内容已按 Content-Encoding 解码，因此以 Content-Type 判断。
+        """
+        content = response.content
+        if not content or len(content) < self.server_settings.compression_min_size:
+            return False
 
-            # 根据参数名称确定期望的类型
-            if key == "method":
-                validated_params[key] = str(value) if value is not None else None
-            elif key in ["headers", "cookies", "params", "data", "json", "extensions"]:
-                # 这些应该是字典类型
-                if isinstance(value, dict):
-                    validated_params[key] = value
-                elif value is not None:
-                    # 如果不是字典但不为None，则尝试转换或抛出错误
-                    raise TypeError(f"Parameter '{key}' must be a dict, got {type(value)}")
-                else:
-                    validated_params[key] = None
-            elif key in ["timeout", "retry_delay"]:
-                # 这些应该是浮点数
-                validated_params[key] = float(value) if value is not None else None
-            elif key in ["max_retries"]:
-                # 这些应该是整数
-                validated_params[key] = int(value) if value is not None else None
-            elif key in ["verify", "allow_redirects", "stream"]:
-                # 这些应该是布尔值
-                validated_params[key] = bool(value) if value is not None else None
-            elif key in ["proxy", "impersonate", "automation_config", "automation_script", "kwargs"]:
-                # 这些应该是字符串
-                validated_params[key] = str(value) if value is not None else None
-            else:
-                # 对于其他参数，保持原值
-                validated_params[key] = value
-
-        return validated_params
+        content_type = (response.get_content_type() or "").lower()
+        return not content_type.startswith(PRECOMPRESSED_CONTENT_TYPES) or content_type.endswith("+xml")
 
     @staticmethod
     def _build_grpc_response(request: task_pb2.ReqTask, response: Response) -> task_pb2.TaskResp:
@@ -188,19 +428,23 @@ class TaskService(task_pb2_grpc.TaskServiceServicer):
         Returns:
             task_pb2.TaskResp: gRPC响应对象
         """
-        return task_pb2.TaskResp(
-            request_uuid=request.uuid,
-            adapter=request.adapter,
-            original_request=request,
-            effective_url=response.url,
-            status_code=response.status_code,
-            response_headers=response.headers or {},
-            content=response.content or b"",
-            error_message=str(response.exception) if response.exception else "",
-            response_time_ms=response.elapsed_ms,
-        )
+        grpc_response = task_pb2.TaskResp()
+        # 字段逐个赋值，比关键字参数构造少走一遍通用的初始化逻辑；空的响应头与响应体直接跳过
+        if response.headers:
+            grpc_response.response_headers.update(response.headers)
+        if response.content:
+            grpc_response.content = response.content
+        grpc_response.request_uuid = request.uuid
+        grpc_response.adapter = request.adapter
+        grpc_response.effective_url = response.url
+        grpc_response.status_code = response.status_code
+        grpc_response.response_time_ms = response.elapsed_ms
+        # 仅在失败时才格式化异常信息
+        if response.exception is not None:
+            grpc_response.error_message = str(response.exception)
+        return grpc_response
 
-    def cleanup(self):
+    async def cleanup(self):
         """
         清理资源
 
@@ -210,10 +454,10 @@ class TaskService(task_pb2_grpc.TaskServiceServicer):
 
         for name, adapter in self._adapter_cache.items():
             try:
-                adapter.close()
-                log.debug(f"Closed adapter: {name}")
+                await adapter.aclose()
+                log.debug("Closed adapter: {}", name)
             except Exception as e:
-                log.warning(f"Error closing adapter {name}: {e}")
+                log.warning("Error closing adapter {}: {}", name, e)
 
-        ADAPTER_CLASSES.clear()
+        self._adapter_cache.clear()
         log.info("TaskService cleanup completed")
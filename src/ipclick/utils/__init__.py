@@ -1,9 +1,16 @@
-
-import re
+import json
 from datetime import date, datetime, time
 from typing import Any
 
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
 # 自定义JSON序列化器
 def json_serializer(obj: Any):
     if isinstance(obj, (datetime, date, time)):
@@ -11,26 +18,35 @@ def json_serializer(obj: Any):
     raise TypeError(f"Type {type(obj)!r} not serializable")
 
 
-# ISO日期时间正则表达式
-ISO_DATETIME_RE = re.compile(r"^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}")
+_fromisoformat = datetime.fromisoformat
 
 
-# 自定义JSON反序列化器
-def json_hook(obj: Any):
-    def json_deserializer(value):
-        if isinstance(value, str):
-            try:
-                # 处理带/不带微秒与时区的情况，优先用 fromisoformat（Py3.7+）
-                return datetime.fromisoformat(value).replace(microsecond=0)
-            except Exception:
-                # 备用：简单日期检测
-                if ISO_DATETIME_RE.match(value):
-                    try:
-                        return datetime.strptime(value, "%Y-%m-%dT%H:%M:%S")
-                    except Exception:
-                        pass
-        return value
+def _revive_iso(value: Any) -> Any:
+    """ISO 8601 日期时间字符串转为 datetime（去掉微秒），其他值原样返回"""
+    # 先按 YYYY-MM-DDTHH:MM:SS 的分隔符位置快速筛选，绝大多数字符串无需进入异常处理
+    if isinstance(value, str) and len(value) >= 19 and value[4] == "-" and value[7] == "-" and value[10] == "T":
+        try:
+            # 处理带/不带微秒与时区的情况
+            return _fromisoformat(value).replace(microsecond=0)
+        except ValueError:
+            pass
+    return value
 
+
+# 自定义JSON反序列化器
+def json_hook(obj: dict[str, Any]) -> dict[str, Any]:
     for k, v in obj.items():
-        obj[k] = json_deserializer(v)
+        revived = _revive_iso(v)
+        # 只在值被转换时写回
+        if revived is not v:
+            obj[k] = revived
     return obj
+
+
+def json_loads(value: str | bytes) -> Any:
+    """
+    反序列化JSON，已安装 orjson 时优先使用
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(value)
+    return json.loads(value)
@@ -1,12 +1,21 @@
+from dataclasses import dataclass, field
+import functools
+import json
+import os
 from pathlib import Path
 import tomllib
-from typing import cast
+from typing import Any, Self
 
 from box import Box
 
+from ipclick.utils import ORJSON_AVAILABLE, json_serializer
 from ipclick.utils.log_util import log
 
 
+if ORJSON_AVAILABLE:
+    import orjson
+
+
 class Settings(Box):
     """一个用于保存配置设置的 Box 子类。
 
@@ -16,6 +25,101 @@ class Settings(Box):
     pass
 
 
+def default_max_workers() -> int:
+    """未配置 max_workers 时的线程数，与 ThreadPoolExecutor 对 I/O 密集任务的默认取值一致"""
+    return min(32, (os.cpu_count() or 1) * 5)
+
+
+@dataclass(frozen=True, slots=True)
+class ServerSettings:
+    """服务端配置（[SERVER] 节）。
+
+    启动时从 Settings 中解析一次，之后以属性访问代替逐层的 dict 查找。
+    """
+
+    host: str = "[::]"
+    port: int = 9527
+    max_workers: int = field(default_factory=default_max_workers)
+    processes: int = 1
+    compression_min_size: int = 1024
+    max_concurrent_streams: int | None = None
+    batch_concurrency: int | None = None
+    max_message_length: int = 500 * 1024 * 1024
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> Self:
+        """从 Settings 的 [SERVER] 节构造，缺失的项使用默认值。
+
+        Args:
+            settings: 已加载的 Settings 对象。
+
+        Returns:
+            不可变的 ServerSettings 对象。
+        """
+        server: dict[str, Any] = settings.get("SERVER", {})
+        return cls(**{name: server[name] for name in cls.__slots__ if name in server})
+
+
+@dataclass(frozen=True, slots=True)
+class OffloadSettings:
+    """大响应体外部存储配置（[SERVER.offload] 节）。
+
+    启用后超过 threshold 字节的响应体上传到 S3/MinIO，gRPC 响应只回传预签名下载地址。
+    """
+
+    enabled: bool = False
+    threshold: int = 1024 * 1024
+    endpoint: str = "127.0.0.1:9000"
+    access_key: str = ""
+    secret_key: str = ""
+    bucket: str = "ipclick"
+    secure: bool = False
+    expires: int = 3600
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> Self:
+        """从 Settings 的 [SERVER.offload] 节构造，缺失的项使用默认值。
+
+        Args:
+            settings: 已加载的 Settings 对象。
+
+        Returns:
+            不可变的 OffloadSettings 对象。
+        """
+        offload: dict[str, Any] = settings.get("SERVER", {}).get("offload", {})
+        return cls(**{name: offload[name] for name in cls.__slots__ if name in offload})
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_toml(path: str, mtime_ns: int, size: int) -> dict[str, Any]:
+    """读取并解析 TOML 文件，按（路径, 修改时间, 大小）缓存，文件变化后自动重新解析。
+
+    返回的字典为缓存共享对象，调用方不应修改，只用于构造新的 Settings。
+    """
+    # TOML 规定为 UTF-8 编码，以二进制方式交给 tomllib 解码，不经过中间字符串
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def _deep_update(target: dict[str, Any], source: dict[str, Any]) -> None:
+    """将 source 深度合并到 target：两侧均为字典的键逐层合并，其余值直接覆盖
+
+    两侧均来自 Settings.to_dict() 或 TOML 解析结果，只含普通 dict，用 type() is dict 判断；
+    以显式栈代替递归。source 中的字典逐层复制到 target，不会被之后的合并修改，可以是缓存的解析结果。
+    """
+    stack = [(target, source)]
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            if type(value) is dict:
+                current = target.get(key)
+                if type(current) is not dict:
+                    current = target[key] = {}
+                stack.append((current, value))
+            else:
+                target[key] = value
+
+
 class ConfigUtil:
     """用于从 TOML 文件加载和合并配置的实用类。
 
@@ -23,46 +127,44 @@ class ConfigUtil:
     """
 
     @staticmethod
-    def load(path: str | Path | list[str | Path], encoding: str = "utf-8") -> Settings:
+    def load(path: str | Path | list[str | Path], encoding: str = "utf-8", frozen: bool = False) -> Settings:
         """从一个或多个 TOML 文件加载配置到 Settings 对象中。
 
         支持从单个路径或路径列表加载。如果文件不存在，则记录警告并跳过它。合并所有有效的配置。
+        文件内容未变化时复用已解析的结果，不重复读取与解析。
 
         Args:
             path: 单个文件路径（str 或 Path）或文件路径列表。
-            encoding: 读取文件时使用的编码（默认："utf-8"）。
+            encoding: 仅为兼容保留，TOML 文件固定按 UTF-8 解析。
+            frozen: 是否返回只读的 Settings，只读时可在多处共享而无需防御性复制，修改会抛出 BoxError。
 
         Returns:
             来自所有有效文件的合并 Settings 对象。
         """
-        log.debug(f"load path ==> {repr(path)}")
+        log.debug("load path ==> {!r}", path)
         file_paths = [path] if isinstance(path, (str, Path)) else path
 
-        setting_config_list: list[Settings] = []
+        # 直接合并解析结果，不为每个文件构造 Settings 再转换回字典
+        merged: dict[str, Any] = {}
         for file_path in file_paths:
             path = Path(file_path)
-            if not path.exists():
-                log.debug(f"配置文件 {file_path} 不存在")
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                log.debug("配置文件 {} 不存在", file_path)
                 continue
             try:
-                with open(path, "r", encoding=encoding) as f:
-                    config = tomllib.loads(f.read())
-                    try:
-                        setting = Settings(config)
-                        setting_config_list.append(setting)
-                    except (TypeError, ValueError, AttributeError):
-                        log.exception(f"配置文件 {file_path} 转换 Settings出错！")
-
+                _deep_update(merged, _parse_toml(str(path), stat.st_mtime_ns, stat.st_size))
             except tomllib.TOMLDecodeError:
-                log.exception(f"配置文件 {file_path} 解析出错！")
+                log.exception("配置文件 {} 解析出错！", file_path)
 
-        return ConfigUtil.merge(setting_config_list)
+        return Settings(merged, frozen_box=frozen)
 
     @staticmethod
     def merge(settings: list[Settings]) -> Settings:
         """将 Settings 对象列表合并为单个 Settings 对象。
 
-        复制第一个 Settings，并使用 += 运算符合并后续的 Settings。
+        先将各 Settings 转为普通字典并依次深度合并，最后只构造一次 Settings。
 
         Args:
             settings: 要合并的 Settings 对象列表。
@@ -70,11 +172,25 @@ class ConfigUtil:
         Returns:
             一个新的合并 Settings 对象。
         """
-        if not settings:
-            return Settings()
+        merged: dict[str, Any] = {}
+        for setting in settings:
+            _deep_update(merged, setting.to_dict())
+
+        return Settings(merged)
+
+    @staticmethod
+    def to_json(settings: Settings, indent: bool = False) -> str:
+        """将 Settings 序列化为 JSON 字符串。
+
+        已安装 orjson 时直接序列化 Settings，不经过 to_dict() 复制；TOML 中的日期时间转为 ISO 8601 字符串。
 
-        setting_merged = cast(Settings, settings[0].copy())
-        for setting in settings[1:]:
-            setting_merged += setting
+        Args:
+            settings: 要序列化的 Settings 对象。
+            indent: 是否缩进输出，便于阅读。
 
-        return setting_merged
+        Returns:
+            JSON 字符串。
+        """
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(settings, option=orjson.OPT_INDENT_2 if indent else None).decode()
+        return json.dumps(settings, ensure_ascii=False, indent=2 if indent else None, default=json_serializer)
@@ -1,9 +1,12 @@
-import functools
+from datetime import UTC, datetime, timedelta
+from operator import itemgetter
+import os
 from pathlib import Path
 import sqlite3
 from sqlite3 import Connection
 import sys
-from typing import Any, Callable, ClassVar, Protocol, TypeVar, cast
+import threading
+from typing import Any, Callable, ClassVar, Protocol
 
 from loguru import logger
 from typing_extensions import runtime_checkable
@@ -11,7 +14,20 @@ from typing_extensions import runtime_checkable
 from ipclick.utils.path_util import PathUtil
 
 
-F = TypeVar("F", bound=Callable[..., Any])
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
 
 
 @runtime_checkable
@@ -31,44 +47,158 @@ class DatabaseAdapter(Protocol):
         ...
 
 
+# SQLiteAdapter 可选的日志模式与同步级别
+_SQLITE_JOURNAL_MODES = ("DELETE", "TRUNCATE", "PERSIST", "MEMORY", "WAL", "OFF")
+_SQLITE_SYNCHRONOUS = ("OFF", "NORMAL", "FULL", "EXTRA")
+
+# 写入 log_levels 表的 loguru 内置级别
+_BUILTIN_LEVEL_NAMES = ("TRACE", "DEBUG", "INFO", "SUCCESS", "WARNING", "ERROR", "CRITICAL")
+
+# 日志表中的时间戳为 UTC 微秒数
+_UNIX_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_MICROSECOND = timedelta(microseconds=1)
+
+# 一次取出写入日志表所需的记录字段
+_record_fields = itemgetter("time", "level", "message", "file", "line", "function", "process", "thread", "exception")
+
+
+def _record_to_row(record: dict[str, Any]) -> tuple[Any, ...]:
+    """把 loguru 记录字典转换为日志表的一行"""
+    time, level, message, file, line, function, process, thread, exception = _record_fields(record)
+    return (
+        (time - _UNIX_EPOCH) // _MICROSECOND,  # 时间转换为 UTC 微秒数
+        level.no,
+        message,
+        file.path,
+        line,
+        function,
+        process.id,
+        thread.id,
+        str(exception) if exception else None,
+    )
+
+
+def _zstd_compress(path: str) -> None:
+    """把轮转出的日志文件压缩为 .zst 后删除原文件"""
+    source = Path(path)
+    with source.open("rb") as src, open(f"{path}.zst", "wb") as dst:
+        zstandard.ZstdCompressor(level=3, threads=-1).copy_stream(src, dst)
+    source.unlink()
+
+
+def _zstd_rotate(path: str) -> None:
+    """loguru 轮转压缩回调：在单独的线程中压缩，不阻塞后续日志写入文件"""
+    threading.Thread(target=_zstd_compress, args=(path,), name="ipclick-log-zstd").start()
+
+
 class SQLiteAdapter(DatabaseAdapter):
     """SQLite 数据库适配器实现
 
     这个类实现了将日志消息存储到 SQLite 数据库的功能。
     它遵循 DatabaseAdapter 协议，并提供了具体的 SQLite 实现。
 
+    write() 只把日志记录追加到内存缓冲区，不做磁盘 I/O；后台线程每隔 flush_interval 秒或缓冲满
+    batch_size 条时以一次 executemany + commit 批量写入。缓冲区最多保留 max_pending 条，
+    写入跟不上时丢弃新记录并计入 dropped，内存占用有上限。日志器移除或程序退出时由 loguru 调用 stop() 写入剩余记录并关闭连接。
+
     Attributes:
         db_path: SQLite 数据库文件路径
         table_name: 存储日志的表名
         conn: SQLite 数据库连接对象
+        batch_size: 每批写入的日志条数
+        flush_interval: 后台线程写入缓存记录的间隔（秒）
+        max_pending: 缓冲区最多保留的日志条数
+        dropped: 因缓冲区已满或写入失败而丢弃的日志条数
     """
 
-    def __init__(self, db_path: str, table_name: str = "logs"):
+    def __init__(
+        self,
+        db_path: str,
+        table_name: str = "logs",
+        batch_size: int = 100,
+        flush_interval: float = 1.0,
+        journal_mode: str = "WAL",
+        synchronous: str = "NORMAL",
+        cache_size_kb: int = 65536,
+        max_pending: int = 10000,
+    ):
         """初始化 SQLite 适配器
 
         Args:
             db_path: SQLite 数据库文件路径
             table_name: 存储日志的表名，默认为 'logs'
+            batch_size: 每批写入的日志条数，默认为 100，为 1 时逐条写入
+            flush_interval: 后台线程写入缓存记录的间隔（秒），默认为 1.0
+            journal_mode: SQLite 日志模式，默认为 'WAL'，写入不阻塞读取
+            synchronous: SQLite 同步级别，默认为 'NORMAL'：WAL 模式下提交时不 fsync，
+                断电时可能丢失最近一次检查点之后的日志；需要完全持久化时使用 'FULL'
+            cache_size_kb: 页缓存大小（KB），默认为 65536
+            max_pending: 缓冲区最多保留的日志条数，默认为 10000
         """
+        if journal_mode.upper() not in _SQLITE_JOURNAL_MODES:
+            raise ValueError(f"journal_mode must be one of {_SQLITE_JOURNAL_MODES}, got {journal_mode!r}")
+        if synchronous.upper() not in _SQLITE_SYNCHRONOUS:
+            raise ValueError(f"synchronous must be one of {_SQLITE_SYNCHRONOUS}, got {synchronous!r}")
+
         self.db_path: str = db_path
         self.table_name: str = table_name
+        self.batch_size: int = batch_size
+        self.flush_interval: float = flush_interval
+        self.max_pending: int = max_pending
+        self.dropped: int = 0
         sql_path = PathUtil.resolve_path(db_path)
         PathUtil.ensure_parent_dir(sql_path)
-        self.conn: Connection = sqlite3.connect(db_path, check_same_thread=False, timeout=10.0)
+        # 关闭 sqlite3 模块的隐式事务，批量写入时显式 BEGIN IMMEDIATE / COMMIT
+        self.conn: Connection = sqlite3.connect(db_path, check_same_thread=False, timeout=10.0, isolation_level=None)
+        # 追加写入为主的日志库：默认 WAL + synchronous=NORMAL，加大页缓存并启用内存映射读取
+        self.conn.executescript(
+            f"PRAGMA journal_mode={journal_mode};"
+            f"PRAGMA synchronous={synchronous};"
+            "PRAGMA temp_store=MEMORY;"
+            f"PRAGMA cache_size=-{int(cache_size_kb)};"
+            "PRAGMA mmap_size=268435456;"
+        )
         self._create_table()
+        self._insert_sql: str = (
+            f"INSERT INTO {self.table_name} "
+            "(timestamp, level, message, file, line, function, process_id, thread_id, exception) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+        )
+        # 缓冲区保存 loguru 的记录字典，转换为数据库行的开销由后台线程承担
+        self._pending: list[dict[str, Any]] = []
+        # _lock 只保护缓冲区，_db_lock 保护数据库写入，追加记录不会等待磁盘 I/O
+        self._lock: threading.Lock = threading.Lock()
+        self._db_lock: threading.Lock = threading.Lock()
+        # 后台线程定期写入缓存记录，日志稀少时记录也不会长时间停留在内存中
+        self._wakeup: threading.Event = threading.Event()
+        self._closed: bool = False
+        self._flusher: threading.Thread = threading.Thread(
+            target=self._flush_loop, name="ipclick-log-sqlite", daemon=True
+        )
+        self._flusher.start()
 
     def _create_table(self):
         """创建日志表，如果不存在
 
         此方法会在数据库中创建一个日志表，如果该表尚不存在。
         表包含时间戳、日志级别、消息、文件位置、线程/进程ID等信息。
+        时间戳以 UTC 微秒整数、级别以 loguru 的级别数值保存，并为按时间、按级别加时间的查询建立索引，
+        级别可用 level >= 30 这样的范围条件过滤。log_levels 表记录内置级别的名称，
+        视图 {table_name}_v 提供可读的时间列 ts_iso 与级别名称列 level_name。
+        旧版本以文本保存时间戳和级别的表会被原地迁移。
         """
-        cursor = self.conn.cursor()
-        cursor.execute(f"""  
-            CREATE TABLE IF NOT EXISTS {self.table_name} (
+        table = self.table_name
+        self.conn.execute("CREATE TABLE IF NOT EXISTS log_levels (no INTEGER PRIMARY KEY, name TEXT)")
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO log_levels (no, name) VALUES (?, ?)",
+            [(logger.level(name).no, name) for name in _BUILTIN_LEVEL_NAMES],
+        )
+
+        create_sql = f"""
+            CREATE TABLE IF NOT EXISTS {table} (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp TEXT,
-                level TEXT,
+                timestamp INTEGER,
+                level INTEGER,
                 message TEXT,
                 file TEXT,
                 line INTEGER,
@@ -77,84 +207,273 @@ class SQLiteAdapter(DatabaseAdapter):
                 thread_id INTEGER,
                 exception TEXT
             )
+        """
+        columns = {row[1]: row[2].upper() for row in self.conn.execute(f"PRAGMA table_info({table})")}
+        if columns and (columns.get("timestamp") != "INTEGER" or columns.get("level") != "INTEGER"):
+            self._migrate_table(columns, create_sql)
+        else:
+            self.conn.execute(create_sql)
+
+        self.conn.executescript(f"""
+            CREATE INDEX IF NOT EXISTS idx_{table}_ts ON {table}(timestamp);
+            CREATE INDEX IF NOT EXISTS idx_{table}_level_ts ON {table}(level, timestamp);
+            CREATE VIEW IF NOT EXISTS {table}_v AS
+                SELECT t.id, strftime('%Y-%m-%dT%H:%M:%f', t.timestamp / 1000000.0, 'unixepoch') AS ts_iso,
+                       t.level, coalesce(l.name, t.level) AS level_name, t.message, t.file, t.line, t.function,
+                       t.process_id, t.thread_id, t.exception
+                FROM {table} AS t LEFT JOIN log_levels AS l ON l.no = t.level;
         """)
-        self.conn.commit()
+
+    def _migrate_table(self, columns: dict[str, str], create_sql: str) -> None:
+        """把旧版本创建的日志表迁移为整数时间戳与级别
+
+        在一个事务中把旧表改名，按新结构建表后转换并复制全部记录，再删除旧表；出错时回滚，旧表保持不变。
+        ISO 时间字符串按其时区偏移转换为 UTC 微秒数（保留到毫秒），级别名称经 log_levels 转为数值，
+        自定义级别的名称无法对应时为 NULL。
+
+        Args:
+            columns: 旧表的列名与声明类型
+            create_sql: 新表的建表语句
+        """
+        table = self.table_name
+        old_table = f"{table}__migrating"
+        if columns.get("timestamp") == "INTEGER":
+            timestamp_expr = "timestamp"
+        else:
+            timestamp_expr = (
+                "CAST(strftime('%s', timestamp) AS INTEGER) * 1000000"
+                " + CAST(substr(strftime('%f', timestamp), 4) AS INTEGER) * 1000"
+            )
+        if columns.get("level") == "INTEGER":
+            level_expr = "level"
+        else:
+            level_expr = "(SELECT no FROM log_levels WHERE name = level)"
+
+        log.warning("Migrating log table {} in {} to integer timestamp and level columns", table, self.db_path)
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # 改名会让旧视图指向旧表，先删除，之后按新结构重建
+            self.conn.execute(f"DROP VIEW IF EXISTS {table}_v")
+            self.conn.execute(f"ALTER TABLE {table} RENAME TO {old_table}")
+            self.conn.execute(create_sql)
+            self.conn.execute(f"""
+                INSERT INTO {table}
+                    (id, timestamp, level, message, file, line, function, process_id, thread_id, exception)
+                SELECT id, {timestamp_expr}, {level_expr}, message, file, line, function,
+                       process_id, thread_id, exception
+                FROM {old_table}
+            """)
+            self.conn.execute(f"DROP TABLE {old_table}")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+        self.conn.execute("COMMIT")
 
     def write(self, log_message: Any) -> None:
         """写入日志记录到 SQLite 数据库
 
-        从 loguru 消息对象中提取日志记录信息并将其插入到 SQLite 数据库中。
+        只把 loguru 的记录字典追加到缓冲区，由后台线程转换后批量插入到 SQLite 数据库中。
 
         Args:
             log_message: loguru 的 Message 对象，包含 .record (dict)
         """
         record = log_message.record
 
-        timestamp = record["time"].isoformat()  # 时间转换为 ISO 字符串
-        level = record["level"].name
-        message = record["message"]
-        file = record["file"].path
-        line = record["line"]
-        function = record["function"]
-        process_id = record["process"].id
-        thread_id = record["thread"].id
-        exception = str(record["exception"]) if record["exception"] else None
-
-        with self.conn:
-            self.conn.execute(
-                f"""
-                INSERT INTO {self.table_name} (timestamp, level, message, file, line, function, process_id, thread_id, exception)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    timestamp,
-                    level,
-                    message,
-                    file,
-                    line,
-                    function,
-                    process_id,
-                    thread_id,
-                    exception,
-                ),
-            )
+        with self._lock:
+            # 缓冲区已满或适配器已关闭时丢弃
+            if self._closed or len(self._pending) >= self.max_pending:
+                self.dropped += 1
+                return
+            self._pending.append(record)
+            if len(self._pending) >= self.batch_size:
+                self._wakeup.set()
+
+    def _flush_loop(self) -> None:
+        """后台线程：每隔 flush_interval 秒或缓冲区满一批时写入缓存的日志记录，直到适配器关闭"""
+        while not self._closed:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self._write_pending()
+            except Exception as e:
+                # 写入失败（如数据库被其他进程锁定、磁盘已满）时线程继续运行，下一批照常写入；
+                # 直接输出到 stderr，不经 loguru，避免失败信息再次进入本适配器
+                print(
+                    f"ipclick: failed to write logs to {self.db_path}: {e!r} (dropped: {self.dropped})", file=sys.stderr
+                )
+
+    def _write_pending(self) -> None:
+        """取出缓冲区中的日志记录，在一个事务中写入；写入失败时这批记录计入 dropped"""
+        with self._lock:
+            records, self._pending = self._pending, []
+        if not records:
+            return
+        try:
+            with self._db_lock:
+                # 开始时即取得写锁，避免读写并发时从共享锁升级失败返回 SQLITE_BUSY
+                self.conn.execute("BEGIN IMMEDIATE")
+                try:
+                    self.conn.executemany(self._insert_sql, map(_record_to_row, records))
+                except BaseException:
+                    self.conn.execute("ROLLBACK")
+                    raise
+                self.conn.execute("COMMIT")
+        except BaseException:
+            with self._lock:
+                self.dropped += len(records)
+            raise
+
+    def stop(self) -> None:
+        """停止后台线程，写入剩余的日志记录并关闭数据库连接，由 loguru 在移除日志器或程序退出时调用
+
+        重复调用时不做任何操作，之后收到的日志记录计入 dropped。
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wakeup.set()
+        self._flusher.join()
+        try:
+            self._write_pending()
+        finally:
+            self.conn.close()
 
     def close(self):
         """关闭数据库连接（可选，在程序结束时调用）
 
-        关闭与 SQLite 数据库的连接。此方法应在应用程序结束时调用，
-        以确保正确释放数据库资源。
+        写入剩余的日志记录后关闭与 SQLite 数据库的连接。此方法应在应用程序结束时调用，
+        以确保正确释放数据库资源；日志器移除时 loguru 已调用 stop()，再次调用不做任何操作。
         """
-        self.conn.close()
+        self.stop()
 
 
-def ensure_configured(func: F) -> F:
-    """装饰器：确保日志工具已配置后再执行被装饰的方法
+class ParquetAdapter(DatabaseAdapter):
+    """Parquet 文件适配器实现
 
-    此装饰器检查日志工具是否已配置，如果没有，则先进行配置。
+    以列式格式追加写入日志，适合只写入、事后批量分析的日志归档场景；写入开销和文件体积都明显小于 SQLite。
+    字段与 SQLiteAdapter 的日志表相同。每累积 batch_size 条写入一个行组，
+    日志器移除或程序退出时由 loguru 调用 stop() 写入剩余记录并写入文件尾，之后才能读取该文件。
 
-    Args:
-        func: 被装饰的函数
+    Parquet 文件不能追加，每个进程每次运行写入单独的文件 {stem}-{pid}-{启动时间}.parquet，
+    不会覆盖之前运行的日志，多进程服务的各个进程也不会互相覆盖；同一目录下的文件可作为一个数据集读取。
 
-    Returns:
-        装饰后的函数
+    需要安装 pyarrow。
+
+    Attributes:
+        file_path: Parquet 文件路径模板，实际文件名在其文件名后附加进程号与启动时间
+        current_path: 当前进程正在写入的文件路径，写入第一个行组前为 None
+        batch_size: 每个行组的日志条数
+        compression: Parquet 压缩算法
+        dropped: 文件关闭后收到而丢弃的日志条数
     """
 
-    @functools.wraps(func)
-    def wrapper(*args: Any, **kwargs: Any):
-        if args:
-            cls = args[0]
-            if hasattr(cls, "_ensure_configured"):
-                cls._ensure_configured()
-        else:
-            pass
-        return func(*args, **kwargs)
+    def __init__(self, file_path: str | Path, batch_size: int = 10000, compression: str = "zstd"):
+        """初始化 Parquet 适配器
+
+        Args:
+            file_path: Parquet 文件路径模板，例如 'logs/ipclick.parquet'
+            batch_size: 每个行组的日志条数，默认为 10000
+            compression: Parquet 压缩算法，默认为 'zstd'
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError("pyarrow is not installed. Install it with: pip install pyarrow")
+
+        self.file_path: Path = PathUtil.resolve_path(file_path)
+        self.batch_size: int = batch_size
+        self.compression: str = compression
+        PathUtil.ensure_parent_dir(self.file_path)
+        self._schema: pa.Schema = pa.schema(
+            [
+                ("timestamp", pa.int64()),
+                ("level", pa.int32()),
+                ("message", pa.string()),
+                ("file", pa.string()),
+                ("line", pa.int32()),
+                ("function", pa.string()),
+                ("process_id", pa.int64()),
+                ("thread_id", pa.int64()),
+                ("exception", pa.string()),
+            ]
+        )
+        self.dropped: int = 0
+        self.current_path: Path | None = None
+        self._writer: pq.ParquetWriter | None = None
+        self._closed: bool = False
+        self._pending: list[dict[str, Any]] = []
+        self._lock: threading.Lock = threading.Lock()
 
-    return cast(F, wrapper)
+    def write(self, log_message: Any) -> None:
+        """缓存日志记录，累积满 batch_size 条时写入一个行组
+
+        Args:
+            log_message: loguru 的 Message 对象，包含 .record (dict)
+        """
+        with self._lock:
+            # 文件尾已写入，不能再追加
+            if self._closed:
+                self.dropped += 1
+                return
+            self._pending.append(log_message.record)
+            if len(self._pending) >= self.batch_size:
+                self._write_pending()
+
+    def _write_pending(self) -> None:
+        """把缓存的日志记录按列写入一个行组，调用方需持有 _lock"""
+        records, self._pending = self._pending, []
+        if not records:
+            return
+        columns = zip(*map(_record_to_row, records))
+        batch = pa.RecordBatch.from_arrays(
+            [pa.array(column, type=field.type) for column, field in zip(columns, self._schema)],
+            schema=self._schema,
+        )
+        if self._writer is None:
+            # 写入第一个行组时才确定文件名，fork 出的子进程使用自己的进程号
+            started = datetime.now().strftime("%Y%m%d%H%M%S%f")
+            self.current_path = self.file_path.with_name(
+                f"{self.file_path.stem}-{os.getpid()}-{started}{self.file_path.suffix or '.parquet'}"
+            )
+            self._writer = pq.ParquetWriter(self.current_path, self._schema, compression=self.compression)
+        self._writer.write_batch(batch)
+
+    def stop(self) -> None:
+        """写入剩余的日志记录并关闭文件，由 loguru 在移除日志器或程序退出时调用"""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._write_pending()
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+
+    def close(self):
+        """关闭文件（可选，在程序结束时调用）"""
+        self.stop()
 
 
 logger.remove()
 
+# 默认日志格式，进程/线程等字段由 loguru 在记录时填充
+_CONSOLE_FORMAT = (
+    "[<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green>]"
+    "<level> {level: <9}</level>"
+    "[<cyan>{process.name}:{process}</cyan>]"
+    "[<magenta>{thread.name}:{thread}</magenta>]"
+    " <bold>[<yellow>{file}</yellow>]<yellow>{name}</yellow>:<yellow>{function}</yellow>:<underline>{line}</underline></bold> "
+    "| <level>{message}</level>"
+)
+
+# loguru 内置级别的数值，日志方法据此在调用 loguru 之前过滤
+_LEVEL_TRACE = 5
+_LEVEL_DEBUG = 10
+_LEVEL_INFO = 20
+_LEVEL_SUCCESS = 25
+_LEVEL_WARNING = 30
+_LEVEL_ERROR = 40
+_LEVEL_CRITICAL = 50
+
 
 class LogUtil:
     """日志工具类
@@ -178,7 +497,20 @@ class LogUtil:
 
     _configurations: ClassVar[dict[str, dict[str, Any]]] = {}
     _default_logger_name: ClassVar[str] = "default"
-    _depth: ClassVar[int] = 2
+    _depth: ClassVar[int] = 1
+    # 预先创建的 loguru 日志方法，避免每次记录都调用 logger.opt() 新建 Logger 对象
+    _lg_trace: ClassVar[Callable[..., None]] = logger.opt(depth=_depth).trace
+    _lg_debug: ClassVar[Callable[..., None]] = logger.opt(depth=_depth).debug
+    _lg_debug_exc: ClassVar[Callable[..., None]] = logger.opt(depth=_depth, exception=True).debug
+    _lg_debug_lazy: ClassVar[Callable[..., None]] = logger.opt(depth=_depth, lazy=True).debug
+    _lg_info: ClassVar[Callable[..., None]] = logger.opt(depth=_depth).info
+    _lg_success: ClassVar[Callable[..., None]] = logger.opt(depth=_depth).success
+    _lg_warning: ClassVar[Callable[..., None]] = logger.opt(depth=_depth).warning
+    _lg_error: ClassVar[Callable[..., None]] = logger.opt(depth=_depth).error
+    _lg_critical: ClassVar[Callable[..., None]] = logger.opt(depth=_depth).critical
+    _lg_exception: ClassVar[Callable[..., None]] = logger.opt(depth=_depth).exception
+    # 所有日志器中最低的级别数值，低于此级别的日志直接丢弃；未配置时为 0，首次记录时触发默认配置
+    _min_level_no: ClassVar[int] = 0
 
     def __init__(self, logger_name: str | None = None):
         """创建日志器实例
@@ -199,7 +531,9 @@ class LogUtil:
         base_dir: Path | None = None,
         rotation: str = "10 MB",
         retention: str = "30 days",
+        compression: str = "gz",
         adapter: DatabaseAdapter | None = None,
+        diagnose: bool = False,
         **kwargs: Any,
     ) -> None:
         """初始化日志工具配置
@@ -214,18 +548,23 @@ class LogUtil:
             base_dir: 基础目录，用于构建日志文件路径
             rotation: 文件轮转大小，当日志文件达到此大小时创建新文件
             retention: 日志文件保留时间，超过此时间的旧文件会被删除
+            compression: 轮转文件的压缩格式，默认为 "gz"；为 "zst" 时使用 zstandard 在后台线程中压缩，
+                比 gzip 更快，需要安装 zstandard
             adapter: 数据库适配器，如果指定则同时输出到数据库
-            **kwargs: 传递给 loguru 的其他参数
+            diagnose: 异常堆栈中是否逐帧显示变量值，默认关闭：开启后每条异常日志的开销随堆栈深度增长，且可能输出敏感数据
+            **kwargs: 传递给 loguru 的其他参数；未指定 enqueue 时由各输出自行决定：控制台直接写入，
+                文件与数据库经 loguru 的后台线程写入，轮转压缩和数据库写入不阻塞记录日志的线程；
+                显式指定时所有输出都使用该值
         """
-        console_format = (
-            "[<green>{time:YYYY-MM-DD HH:mm:ss.SSS}</green>]"
-            "<level> {level: <9}</level>"
-            "[<cyan>{process.name}:{process}</cyan>]"
-            "[<magenta>{thread.name}:{thread}</magenta>]"
-            " <bold>[<yellow>{file}</yellow>]<yellow>{name}</yellow>:<yellow>{function}</yellow>:<underline>{line}</underline></bold> "
-            "| <level>{message}</level>"
-        )
+        # 单方法协议，直接检查 write 属性，比 runtime_checkable Protocol 的 isinstance 检查更轻量
+        if adapter and not callable(getattr(adapter, "write", None)):
+            raise TypeError(f"adapter must implement DatabaseAdapter.write(), got {type(adapter)}")
+
+        if log_file and compression == "zst" and not ZSTD_AVAILABLE:
+            raise ImportError("zstandard is not installed. Install it with: pip install zstandard")
+
         level = level.upper()
+        enqueue: bool | None = kwargs.pop("enqueue", None)
 
         # 如果已经存在这个日志器的配置，先移除旧的handler
         if logger_name in cls._configurations:
@@ -238,7 +577,9 @@ class LogUtil:
             sys.stderr,
             level=level,
             colorize=True,
-            format=format or console_format,
+            format=format or _CONSOLE_FORMAT,
+            enqueue=bool(enqueue),
+            diagnose=diagnose,
             **kwargs,
         )
         handler_ids.append(console_handler)
@@ -254,19 +595,23 @@ class LogUtil:
                 str(resolved_path),
                 level=level,
                 colorize=False,
-                format=format or console_format,
+                format=format or _CONSOLE_FORMAT,
                 rotation=rotation,
                 retention=retention,
-                compression="gz",
+                compression=_zstd_rotate if compression == "zst" else compression,
+                enqueue=True if enqueue is None else enqueue,
+                diagnose=diagnose,
                 **kwargs,
             )
             handler_ids.append(file_handler)
 
         if adapter:
+            # 以对象作为 sink，loguru 移除日志器或程序退出时会调用其 stop()（如有）
             adapter_handler = logger.add(
-                adapter.write,
+                adapter,
                 level=level,
-                enqueue=True,
+                enqueue=True if enqueue is None else enqueue,
+                diagnose=diagnose,
                 **kwargs,
             )
             handler_ids.append(adapter_handler)
@@ -277,6 +622,7 @@ class LogUtil:
             "level": level,
             "adapter": adapter,
         }
+        cls._update_min_level()
 
     @classmethod
     def remove_logger(cls, logger_name: str) -> None:
@@ -289,6 +635,15 @@ class LogUtil:
             for handler_id in cls._configurations[logger_name]["handler_ids"]:
                 logger.remove(handler_id)
             del cls._configurations[logger_name]
+            cls._update_min_level()
+
+    @classmethod
+    def _update_min_level(cls) -> None:
+        """根据当前所有日志器的配置重新计算最低级别"""
+        cls._min_level_no = min(
+            (logger.level(config["level"]).no for config in cls._configurations.values()),
+            default=0,
+        )
 
     @classmethod
     def _ensure_configured(cls, logger_name: str = "default"):
@@ -301,46 +656,80 @@ class LogUtil:
             cls.init(logger_name=logger_name)
 
     # ==================== 核心日志方法 ====================
+    # 先与最低级别比较，被过滤的日志不再检查配置，也不进入 loguru
 
     @classmethod
-    @ensure_configured
     def trace(cls, message: str, *args: Any, **kwargs: Any) -> None:
-        logger.opt(depth=cls._depth).trace(message, *args, **kwargs)
+        if _LEVEL_TRACE < cls._min_level_no:
+            return
+        cls._ensure_configured()
+        cls._lg_trace(message, *args, **kwargs)
+
+    @classmethod
+    def debug(cls, message: str, *args: Any, exc_info: bool = False, **kwargs: Any) -> None:
+        if _LEVEL_DEBUG < cls._min_level_no:
+            return
+        cls._ensure_configured()
+        # exc_info=True 时附带当前异常堆栈
+        (cls._lg_debug_exc if exc_info else cls._lg_debug)(message, *args, **kwargs)
 
     @classmethod
-    @ensure_configured
-    def debug(cls, message: str, *args: Any, **kwargs: Any) -> None:
-        logger.opt(depth=cls._depth).debug(message, *args, **kwargs)
+    def lazy_debug(cls, message: str, *factories: Callable[[], Any], **kwargs: Any) -> None:
+        """记录 DEBUG 日志，格式化参数由无参函数延迟生成
+
+        只有 DEBUG 日志确实会被某个输出接收时才调用 factories，适合序列化大对象等开销较大的参数。
+
+        Args:
+            message: 日志消息，使用 {} 占位
+            *factories: 生成格式化参数的无参函数
+            **kwargs: 按名称占位的格式化参数，值同样为无参函数
+        """
+        if _LEVEL_DEBUG < cls._min_level_no:
+            return
+        cls._ensure_configured()
+        cls._lg_debug_lazy(message, *factories, **kwargs)
 
     @classmethod
-    @ensure_configured
     def info(cls, message: str, *args: Any, **kwargs: Any) -> None:
-        logger.opt(depth=cls._depth).info(message, *args, **kwargs)
+        if _LEVEL_INFO < cls._min_level_no:
+            return
+        cls._ensure_configured()
+        cls._lg_info(message, *args, **kwargs)
 
     @classmethod
-    @ensure_configured
     def success(cls, message: str, *args: Any, **kwargs: Any) -> None:
-        logger.opt(depth=cls._depth).success(message, *args, **kwargs)
+        if _LEVEL_SUCCESS < cls._min_level_no:
+            return
+        cls._ensure_configured()
+        cls._lg_success(message, *args, **kwargs)
 
     @classmethod
-    @ensure_configured
     def warning(cls, message: str, *args: Any, **kwargs: Any) -> None:
-        logger.opt(depth=cls._depth).warning(message, *args, **kwargs)
+        if _LEVEL_WARNING < cls._min_level_no:
+            return
+        cls._ensure_configured()
+        cls._lg_warning(message, *args, **kwargs)
 
     @classmethod
-    @ensure_configured
     def error(cls, message: str, *args: Any, **kwargs: Any) -> None:
-        logger.opt(depth=cls._depth).error(message, *args, **kwargs)
+        if _LEVEL_ERROR < cls._min_level_no:
+            return
+        cls._ensure_configured()
+        cls._lg_error(message, *args, **kwargs)
 
     @classmethod
-    @ensure_configured
     def critical(cls, message: str, *args: Any, **kwargs: Any) -> None:
-        logger.opt(depth=cls._depth).critical(message, *args, **kwargs)
+        if _LEVEL_CRITICAL < cls._min_level_no:
+            return
+        cls._ensure_configured()
+        cls._lg_critical(message, *args, **kwargs)
 
     @classmethod
-    @ensure_configured
     def exception(cls, message: str, *args: Any, **kwargs: Any) -> None:
-        logger.opt(depth=cls._depth).exception(message, *args, **kwargs)
+        if _LEVEL_ERROR < cls._min_level_no:
+            return
+        cls._ensure_configured()
+        cls._lg_exception(message, *args, **kwargs)
 
 
 # 快捷方式
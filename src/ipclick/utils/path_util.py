@@ -15,12 +15,13 @@ class PathUtil:
         Returns:
             Path: 解析后的绝对路径
         """
-        path_obj = Path(path)
+        # 已是 Path 时不再重新构造
+        path_obj = path if isinstance(path, Path) else Path(path)
 
         if path_obj.is_absolute():
             return path_obj
 
-        # 相对路径需要base_dir
+        # 相对路径需要base_dir；工作目录可能在运行中切换，每次调用时读取
         if base_dir is None:
             base_dir = Path.cwd()
 
@@ -34,4 +35,7 @@ class PathUtil:
             path: 文件路径
 
         """
-        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        parent = (path if isinstance(path, Path) else Path(path)).parent
+        # 目录已存在时只需一次 stat，不再逐级尝试创建
+        if not parent.is_dir():
+            parent.mkdir(parents=True, exist_ok=True)
@@ -2,11 +2,17 @@ import hashlib
 import json
 from typing import Any
 
+from ipclick.utils import ORJSON_AVAILABLE
+
+
+if ORJSON_AVAILABLE:
+    import orjson
+
 
 class SecureUtil:
     """提供安全相关的工具方法的工具类。
 
-    该类包含MD5哈希计算等安全相关的实用方法。
+    该类包含MD5、BLAKE2b哈希计算等安全相关的实用方法。
     """
 
     @staticmethod
@@ -53,3 +59,40 @@ class SecureUtil:
         result_cache.append(md5_hash.hexdigest())
 
         return md5_hash.hexdigest()[8:24] if short else md5_hash.hexdigest()
+
+    @staticmethod
+    def blake2b(
+        data: int | str | bytes | dict[str, Any] | list[Any],
+        encoding: str = "utf-8",
+        digest_size: int = 16,
+    ) -> str:
+        """计算给定数据的BLAKE2b哈希值。
+
+        用于缓存键等非安全场景，比MD5更快；需要与已有MD5值保持一致时仍使用 md5。
+
+        Args:
+            data: 需要计算哈希的数据，支持整数、字符串、字节串、字典或列表类型。
+            encoding: 字符串编码格式，默认为"utf-8"。
+            digest_size: 摘要长度（字节），默认为16，即32位十六进制字符串。
+
+        Returns:
+            BLAKE2b哈希值的十六进制字符串表示。
+
+        Example:
+            >>> SecureUtil.blake2b("hello world", digest_size=8)
+            '878633aa32a3b150'
+        """
+        hasher = hashlib.blake2b(digest_size=digest_size)
+
+        for _d in data if isinstance(data, list) else [data]:
+            if isinstance(_d, bytes):
+                hasher.update(_d)
+            elif isinstance(_d, dict):
+                if ORJSON_AVAILABLE:
+                    hasher.update(orjson.dumps(_d, option=orjson.OPT_SORT_KEYS))
+                else:
+                    hasher.update(json.dumps(_d, sort_keys=True, separators=(",", ":")).encode(encoding))
+            else:
+                hasher.update(str(_d).encode(encoding))
+
+        return hasher.hexdigest()
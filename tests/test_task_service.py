@@ -0,0 +1,67 @@
+import asyncio
+
+from ipclick.dto import Response
+from ipclick.dto.proto import task_pb2
+from ipclick.services import TaskService
+from ipclick.utils.config_util import Settings
+
+
+async def _fake_adownload(url: str, **kwargs) -> Response:
+    """不访问网络，直接返回成功响应"""
+    return Response(url=url, status_code=200, content=b"ok")
+
+
+def _make_service() -> TaskService:
+    service = TaskService(Settings({"SERVER": {"max_workers": 2}}))
+    for adapter in service._adapter_cache.values():
+        adapter.adownload = _fake_adownload
+    return service
+
+
+async def _send_batch(service: TaskService, requests: list[task_pb2.ReqTask]) -> list[task_pb2.TaskResp]:
+    async def request_iterator():
+        for request in requests:
+            yield request
+
+    return [response async for response in service.SendBatch(request_iterator(), None)]
+
+
+def test_send_batch_partial_failure():
+    """批次中单个任务出错时，只有该任务返回错误，其余任务正常返回"""
+    service = _make_service()
+    requests = [
+        task_pb2.ReqTask(uuid="good-1", url="https://example.com/1"),
+        # params 须为 JSON 对象，数组会在构建下载参数时抛出 TypeError
+        task_pb2.ReqTask(uuid="bad", url="https://example.com/2", params="[1,2]"),
+        task_pb2.ReqTask(uuid="good-2", url="https://example.com/3"),
+    ]
+
+    responses = {response.request_uuid: response for response in asyncio.run(_send_batch(service, requests))}
+
+    assert set(responses) == {"good-1", "bad", "good-2"}
+    assert responses["good-1"].status_code == 200 and not responses["good-1"].error_message
+    assert responses["good-2"].status_code == 200 and not responses["good-2"].error_message
+    assert "params" in responses["bad"].error_message
+
+
+def test_send_batch_bounded_concurrency():
+    """同时执行的任务数不超过 batch_concurrency"""
+    service = TaskService(Settings({"SERVER": {"batch_concurrency": 2}}))
+    running = peak = 0
+
+    async def slow_adownload(url: str, **kwargs) -> Response:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return Response(url=url, status_code=200)
+
+    for adapter in service._adapter_cache.values():
+        adapter.adownload = slow_adownload
+
+    requests = [task_pb2.ReqTask(uuid=str(i), url=f"https://example.com/{i}") for i in range(10)]
+    responses = asyncio.run(_send_batch(service, requests))
+
+    assert len(responses) == 10
+    assert peak <= 2